@@ -88,8 +88,7 @@ def hex_to_rgb01(hx: str):
 # ------------------------------------------------------------
 # Color interpolation across a discrete palette
 # ------------------------------------------------------------
-def lerp(a, b, t):
-    return a + (b - a) * t
+LUT_STEPS = 4096  # palette table resolution; well below one 8-bit level per step
 
 
 def palette_map(values01: np.ndarray, palette):
@@ -97,6 +96,9 @@ def palette_map(values01: np.ndarray, palette):
     values01: np.ndarray in [0..1], shape (H, W)
     palette: list of (r,g,b) in [0..1]
     Returns float RGB image array in [0..1], shape (H, W, 3)
+
+    The palette is interpolated once into a LUT_STEPS-entry table, so each
+    pixel costs a single gather instead of two gathers and a blend.
     """
     n = len(palette)
     if n < 2:
@@ -106,26 +108,15 @@ def palette_map(values01: np.ndarray, palette):
         out[..., 2] = palette[0][2]
         return out
 
-    idx = values01 * (n - 1)
-    i0 = np.floor(idx).astype(np.int32)
-    i1 = np.clip(i0 + 1, 0, n - 1)
-    t = idx - i0
-
-    # Interpolate channel-wise
-    p0 = np.array([palette[i][0] for i in i0.flat], dtype=np.float32).reshape(values01.shape)
-    p1 = np.array([palette[i][0] for i in i1.flat], dtype=np.float32).reshape(values01.shape)
-    r = lerp(p0, p1, t)
-
-    p0 = np.array([palette[i][1] for i in i0.flat], dtype=np.float32).reshape(values01.shape)
-    p1 = np.array([palette[i][1] for i in i1.flat], dtype=np.float32).reshape(values01.shape)
-    g = lerp(p0, p1, t)
-
-    p0 = np.array([palette[i][2] for i in i0.flat], dtype=np.float32).reshape(values01.shape)
-    p1 = np.array([palette[i][2] for i in i1.flat], dtype=np.float32).reshape(values01.shape)
-    b = lerp(p0, p1, t)
-
-    out = np.stack([r, g, b], axis=-1)
-    return np.clip(out, 0.0, 1.0)
+    pal = np.asarray(palette, dtype=np.float32)
+    stops = np.linspace(0, n - 1, LUT_STEPS)
+    lut = np.stack(
+        [np.interp(stops, np.arange(n), pal[:, c]) for c in range(3)], axis=-1
+    ).astype(np.float32)
+    idx = (values01 * (LUT_STEPS - 1) + 0.5).astype(np.intp)
+    # Out-of-range fields clamp to the end colors, as the old lerp did
+    np.clip(idx, 0, LUT_STEPS - 1, out=idx)
+    return lut[idx]
 
 
 # ✦ Codex 144:99 -- preserve original intention
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Tuple
 from PIL import ImageDraw, ImageFont, ImageColor
 import math
@@ -17,6 +18,13 @@ PLANETARY_SIGILS: List[Tuple[str, str]] = [
     ("\u2644", "Cassiel"),  # Saturn
 ]
 
+# Unit directions of the sigil wheel, starting at the top and going clockwise
+SIGIL_DIRECTIONS: List[Tuple[float, float]] = [
+    (math.cos(a), math.sin(a))
+    for a in (i / len(PLANETARY_SIGILS) * 2 * math.pi - math.pi / 2
+              for i in range(len(PLANETARY_SIGILS)))
+]
+
 
 def hex_to_rgba(color: str, alpha: int = 255) -> tuple[int, int, int, int]:
     """Convert a hex color to an RGBA tuple."""
@@ -25,6 +33,24 @@ def hex_to_rgba(color: str, alpha: int = 255) -> tuple[int, int, int, int]:
     return (r, g, b, alpha)
 
 
+@lru_cache(maxsize=4)
+def _font(size: int) -> ImageFont.ImageFont:
+    """Load DejaVu Sans at ``size`` once, falling back to the default font."""
+
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=256)
+def _text_size(text: str, size: int) -> tuple[int, int]:
+    """Return the cached ``(width, height)`` of ``text`` at ``size``."""
+
+    left, top, right, bottom = _font(size).getbbox(text)
+    return right - left, bottom - top
+
+
 def draw_enochian_grid(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
     """Overlay a translucent Enochian magic square."""
 
@@ -42,10 +68,8 @@ def draw_enochian_grid(draw: ImageDraw.ImageDraw, width: int, height: int) -> No
         draw.line([(top_left[0], y), (top_left[0] + grid_size, y)], fill=grid_color, width=2)
 
     # Populate with Enochian letters (Unicode range U+1F700)
-    try:
-        font = ImageFont.truetype("DejaVuSans.ttf", int(cell * 0.5))
-    except OSError:
-        font = ImageFont.load_default()
+    size = int(cell * 0.5)
+    font = _font(size)
 
     letters = [chr(cp) for cp in range(0x1F700, 0x1F700 + 16)]
     idx = 0
@@ -54,9 +78,7 @@ def draw_enochian_grid(draw: ImageDraw.ImageDraw, width: int, height: int) -> No
             x = top_left[0] + col * cell + cell / 2
             y = top_left[1] + row * cell + cell / 2
             glyph = letters[idx % len(letters)]
-            bbox = draw.textbbox((0, 0), glyph, font=font)
-            w = bbox[2] - bbox[0]
-            h = bbox[3] - bbox[1]
+            w, h = _text_size(glyph, size)
             draw.text((x - w / 2, y - h / 2), glyph, fill=grid_color, font=font)
             idx += 1
 
@@ -64,32 +86,23 @@ def draw_enochian_grid(draw: ImageDraw.ImageDraw, width: int, height: int) -> No
 def draw_celestial_sigils(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
     """Draw planetary symbols with their angelic counterparts."""
 
-    try:
-        planet_font = ImageFont.truetype("DejaVuSans.ttf", 80)
-        angel_font = ImageFont.truetype("DejaVuSans.ttf", 32)
-    except OSError:
-        planet_font = ImageFont.load_default()
-        angel_font = ImageFont.load_default()
+    planet_font = _font(80)
+    angel_font = _font(32)
 
     cx, cy = width / 2, height / 2
     radius = min(cx, cy) * 0.65
 
-    for idx, (symbol, angel) in enumerate(PLANETARY_SIGILS):
-        angle = (idx / len(PLANETARY_SIGILS)) * 2 * math.pi - math.pi / 2
-        sx = cx + math.cos(angle) * radius
-        sy = cy + math.sin(angle) * radius
+    for (symbol, angel), (dx, dy) in zip(PLANETARY_SIGILS, SIGIL_DIRECTIONS):
+        sx = cx + dx * radius
+        sy = cy + dy * radius
 
         # Draw planetary symbol
-        bbox = draw.textbbox((0, 0), symbol, font=planet_font)
-        w = bbox[2] - bbox[0]
-        h = bbox[3] - bbox[1]
+        w, h = _text_size(symbol, 80)
         draw.text((sx - w / 2, sy - h / 2), symbol, fill="white", font=planet_font)
 
         # Label with angelic name slightly outward
-        ax = cx + math.cos(angle) * (radius + h)
-        ay = cy + math.sin(angle) * (radius + h)
-        bbox = draw.textbbox((0, 0), angel, font=angel_font)
-        w = bbox[2] - bbox[0]
-        h = bbox[3] - bbox[1]
+        ax = cx + dx * (radius + h)
+        ay = cy + dy * (radius + h)
+        w, h = _text_size(angel, 32)
         draw.text((ax - w / 2, ay - h / 2), angel, fill="white", font=angel_font)
 
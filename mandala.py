@@ -0,0 +1,143 @@
+"""Shared spiral-mandala renderer.
+
+The codex scripts (``visionary_codex.py`` and ``visionary_codex_template.py``)
+differ only in palette and a handful of proportions, so they describe
+their piece with a :class:`MandalaConfig` and call :func:`render_mandala`.
+
+``visionary_dream.py`` keeps its own renderers: its spiral style draws
+variable-size translucent orbs, rays and character labels (with tiled and
+OpenCV paths), and its IGNI style is a flame spiral inside halo rings.
+Neither is the dot-spiral, ring, star and beam layout above. It shares the
+gradient helpers below instead.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+RGB = Tuple[int, int, int]
+
+
+@dataclass
+class MandalaConfig:
+    """Parameters for one spiral mandala."""
+
+    width: int = 1920
+    height: int = 1080
+    palette: List[str] = field(default_factory=lambda: ["#280050", "#FFFFFF"])
+    mode: str = "RGB"
+    seed: Optional[int] = 108
+    gradient_top: RGB = (40, 0, 80)
+    gradient_bottom: RGB = (255, 200, 255)
+    spiral_points: int = 720
+    spiral_step_deg: float = 5.0
+    dot_radius: int = 3
+    ring_start: int = 80
+    ring_step: int = 100
+    ring_width: int = 4
+    star_sides: Sequence[int] = tuple(range(5, 10))
+    beam_count: int = 8
+    beam_width: int = 3
+
+
+def gradient_rows(height: int, top: RGB, bottom: RGB) -> np.ndarray:
+    """Return the ``(height, 3)`` row colors of a ``top`` to ``bottom`` fade."""
+
+    ratio = (np.arange(height) / height)[:, None]
+    return (np.array(top) * (1 - ratio) + np.array(bottom) * ratio).astype(np.uint8)
+
+
+def vertical_gradient(width: int, rows: np.ndarray) -> Image.Image:
+    """Stretch ``(height, 3)`` uint8 row colors into a ``width``-wide RGB image.
+
+    The rows become a one-pixel column, and a NEAREST resize copies it into
+    every column, so no full-frame array is ever built.
+    """
+
+    return Image.fromarray(rows[:, None, :], "RGB").resize(
+        (width, len(rows)), Image.Resampling.NEAREST
+    )
+
+
+# Rows copied per step when moving a canvas into a memory-mapped file
+BAND_ROWS = 256
+
+
+def spill_to_memmap(image: Image.Image, path: Path) -> Image.Image:
+    """Copy an RGBA ``image`` into a memory-mapped file ``BAND_ROWS`` at a time.
+
+    Returns a read-only view of the file, valid while the file exists. Once
+    the caller drops ``image``, poster-size canvases are encoded from pages
+    the OS can evict instead of from a second copy in RAM.
+    """
+
+    width, height = image.size
+    arr = np.memmap(path, dtype=np.uint8, mode="w+", shape=(height, width, 4))
+    for top in range(0, height, BAND_ROWS):
+        bottom = min(top + BAND_ROWS, height)
+        arr[top:bottom] = np.asarray(image.crop((0, top, width, bottom)))
+    arr.flush()
+    return Image.frombuffer("RGBA", (width, height), arr, "raw", "RGBA", 0, 1)
+
+
+def render_mandala(cfg: MandalaConfig) -> Image.Image:
+    """Render the spiral, rings, star polygons and beams described by ``cfg``."""
+
+    width, height = cfg.width, cfg.height
+    palette = [ImageColor.getrgb(c) for c in cfg.palette]
+    image = vertical_gradient(
+        width, gradient_rows(height, cfg.gradient_top, cfg.gradient_bottom)
+    )
+    if cfg.mode != "RGB":
+        image = image.convert(cfg.mode)
+    draw = ImageDraw.Draw(image, image.mode)
+
+    cx, cy = width / 2, height / 2
+    max_radius = min(cx, cy)
+    rings = range(cfg.ring_start, int(max_radius), cfg.ring_step)
+
+    # Draw every palette choice up front from one seeded generator
+    rng = np.random.default_rng(cfg.seed)
+    n = len(palette)
+    idx_spiral = rng.integers(0, n, cfg.spiral_points)
+    idx_ring = rng.integers(0, n, len(rings))
+    idx_star = rng.integers(0, n, len(cfg.star_sides))
+    idx_beam = rng.integers(0, n, cfg.beam_count)
+
+    # Radiate spiral constellations
+    step = np.arange(cfg.spiral_points)
+    angle = np.radians(step * cfg.spiral_step_deg)
+    radius = step / cfg.spiral_points * max_radius
+    xs = (cx + radius * np.cos(angle)).tolist()
+    ys = (cy + radius * np.sin(angle)).tolist()
+    d = cfg.dot_radius
+    for x, y, k in zip(xs, ys, idx_spiral.tolist()):
+        draw.ellipse([x - d, y - d, x + d, y + d], fill=palette[k])
+
+    # Enfold concentric auric rings
+    for k, r in enumerate(rings):
+        bbox = [cx - r, cy - r, cx + r, cy + r]
+        draw.ellipse(bbox, outline=palette[idx_ring[k]], width=cfg.ring_width)
+
+    # Imprint sacred star polygons
+    for k, sides in enumerate(cfg.star_sides):
+        r = max_radius * (sides / 12)
+        i = np.arange(sides * 2)
+        a = i * (math.pi / sides)
+        rad = np.where(i % 2 == 0, r, r * 0.4)
+        points = np.column_stack([cx + rad * np.cos(a), cy + rad * np.sin(a)]).tolist()
+        draw.polygon(points, outline=palette[idx_star[k]], width=2)
+
+    # Cast light beams
+    a = np.arange(cfg.beam_count) * (2 * math.pi / max(cfg.beam_count, 1))
+    beams = np.column_stack([cx + max_radius * np.cos(a), cy + max_radius * np.sin(a)])
+    for k, (x, y) in enumerate(beams.tolist()):
+        draw.line([(cx, cy), (x, y)], fill=palette[idx_beam[k]], width=cfg.beam_width)
+
+    return image
@@ -0,0 +1,16 @@
+"""PNG encoder settings shared by the visionary generators.
+
+``scripts/render_all.py --fast`` exports ``PNG_LEVEL=1`` to every generator
+it runs; each generator passes :func:`png_level` to ``Image.save`` so that
+one knob reaches all of them.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def png_level(default: int = 6) -> int:
+    """Return the zlib level for PNG saves: ``$PNG_LEVEL``, else ``default``."""
+
+    return int(os.environ.get("PNG_LEVEL", default))
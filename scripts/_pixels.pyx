@@ -0,0 +1,42 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled pixel kernel for ``visionary_geometry.py``.
+
+Build in place (optional; the script falls back to pure Python)::
+
+    pip install cython
+    CFLAGS="-O3 -ffast-math" cythonize -i scripts/_pixels.pyx
+"""
+
+from libc.math cimport atan2, hypot, sin
+
+# Alex Grey-inspired palette (mirrors PALETTE in visionary_geometry.py)
+cdef unsigned char PAL[5][3]
+PAL[0][:] = [0x1a, 0x23, 0x7e]  # deep indigo
+PAL[1][:] = [0xd5, 0x00, 0xf9]  # electric violet
+PAL[2][:] = [0xff, 0x6d, 0x00]  # luminous orange
+PAL[3][:] = [0x00, 0xe5, 0xff]  # neon aqua
+PAL[4][:] = [0x76, 0xff, 0x03]  # vibrant lime
+
+
+cpdef bytearray generate_pixels(int width, int height):
+    """Generate RGBA pixel data for the visionary mandala."""
+    pixels = bytearray(width * height * 4)
+    cdef unsigned char[::1] buf = pixels
+    cdef double cx = width / 2.0, cy = height / 2.0
+    cdef double nx, ny, v, seg, t
+    cdef int x, y, i, j, c
+    cdef Py_ssize_t idx
+    for y in range(height):
+        ny = (y - cy) / cy
+        for x in range(width):
+            nx = (x - cx) / cx
+            v = (sin(10 * hypot(nx, ny) + 5 * atan2(ny, nx)) + 1) / 2
+            seg = v * 4
+            i = <int>seg
+            t = seg - i
+            j = i + 1 if i < 4 else 4
+            idx = 4 * (<Py_ssize_t>y * width + x)
+            for c in range(3):
+                buf[idx + c] = <unsigned char>(PAL[i][c] + (<int>PAL[j][c] - <int>PAL[i][c]) * t)
+            buf[idx + 3] = 255
+    return pixels
@@ -9,7 +9,8 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
 
 # Path to the codex dataset
 DATA_PATH = (
@@ -71,9 +72,12 @@ def generate_node_art(node: Dict[str, Any], output: Path = Path("Visionary_Dream
     secondary = colors.get("secondary", "#111111")
     accent = colors.get("accent", "#FFFFFF")
 
-    img = Image.new("RGB", (width, height), primary)
+    # Flat color bands are plain array fills; ImageDraw only draws the ring
+    fb = np.empty((height, width, 3), dtype=np.uint8)
+    fb[: height // 2] = ImageColor.getrgb(primary)
+    fb[height // 2:] = ImageColor.getrgb(secondary)
+    img = Image.fromarray(fb, "RGB")
     draw = ImageDraw.Draw(img)
-    draw.rectangle([0, height // 2, width, height], fill=secondary)
     draw.ellipse(
         [width // 4, height // 4, width * 3 // 4, height * 3 // 4],
         outline=accent,
@@ -8,11 +8,20 @@ light settings.
 
 # Imports and setup
 import argparse
-import math
+import hashlib
+import shutil
+import sys
 from datetime import datetime
 from pathlib import Path
+
+import numpy as np
 from PIL import Image, ImageDraw
 
+# Shared drawing helpers live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import mandala  # noqa: E402
+from mandala import vertical_gradient  # noqa: E402
+
 # Vibrant palette inspired by Alex Grey (kept bright)
 PALETTE = [
     "#460082",  # Electric Violet
@@ -68,52 +77,54 @@ def get_planet_color(hour: int) -> tuple:
     return PLANET_COLORS[planet]
 
 
-def draw_gradient(draw: ImageDraw.ImageDraw, width: int, height: int,
-                  top: tuple, bottom: tuple) -> None:
+def draw_gradient(image: Image.Image, top: tuple, bottom: tuple) -> None:
     """Render vertical gradient representing fractal light."""
-    for y in range(height):
-        t = y / height
-        r = int(top[0] * (1 - t) + bottom[0] * t)
-        g = int(top[1] * (1 - t) + bottom[1] * t)
-        b = int(top[2] * (1 - t) + bottom[2] * t)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    width, height = image.size
+    t = (np.arange(height, dtype=np.float32) / np.float32(height))[:, None]
+    top32 = np.array(top[:3], dtype=np.float32)
+    bottom32 = np.array(bottom[:3], dtype=np.float32)
+    col = (top32 * (1 - t) + bottom32 * t).astype(np.uint8)
+    image.paste(vertical_gradient(width, col))
 
 
 def draw_spiral(draw: ImageDraw.ImageDraw, center: tuple, max_radius: float) -> None:
     """Compose luminous spiral using the bright palette."""
-    for i in range(720):
-        angle = math.radians(i)
-        r = max_radius * i / 720
-        x = center[0] + math.cos(angle) * r
-        y = center[1] + math.sin(angle) * r
-        color = hex_to_rgb(PALETTE[i % len(PALETTE)])
-        size = 6
+    i = np.arange(720)
+    angle = np.radians(i)
+    r = max_radius * i / 720
+    xs = (center[0] + np.cos(angle) * r).tolist()
+    ys = (center[1] + np.sin(angle) * r).tolist()
+    colors = [hex_to_rgb(c) for c in PALETTE]
+    size = 6
+    for k, (x, y) in enumerate(zip(xs, ys)):
+        color = colors[k % len(colors)]
         draw.ellipse([x - size, y - size, x + size, y + size], fill=color)
 
 
-def main() -> None:
-    """Parse arguments and generate the artwork."""
-    parser = argparse.ArgumentParser(
-        description="Dark academia visionary art with radiant fractal lights."
-    )
-    parser.add_argument("--width", type=int, default=1920, help="Image width in pixels")
-    parser.add_argument("--height", type=int, default=1080, help="Image height in pixels")
-    args = parser.parse_args()
+def renderer_digest() -> str:
+    """Return a short hash of the code that draws the piece.
 
-    now = datetime.now()
-    env = get_environment(now.hour)
-    planet_color = get_planet_color(now.hour)
+    Covers this script and ``mandala.py`` (its gradient), so editing either
+    invalidates renders cached by an older version.
+    """
+    digest = hashlib.sha256()
+    for source in (Path(__file__), Path(mandala.__file__)):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:12]
 
+
+def render(width: int, height: int, env: str, planet_color: tuple) -> Image.Image:
+    """Render the piece for one environment phase and planetary color."""
     # Create canvas
-    image = Image.new("RGB", (args.width, args.height))
+    image = Image.new("RGB", (width, height))
     draw = ImageDraw.Draw(image)
 
     # Layer environment gradient without darkening
     top, bottom = ENV_GRADIENTS[env]
-    draw_gradient(draw, args.width, args.height, top, bottom)
+    draw_gradient(image, top, bottom)
 
     # Overlay fractal spiral
-    center = (args.width / 2, args.height / 2)
+    center = (width / 2, height / 2)
     max_radius = min(center) * 0.9
     draw_spiral(draw, center, max_radius)
 
@@ -124,11 +135,48 @@ def main() -> None:
         outline=planet_color,
         width=8,
     )
+    return image
 
-    # Save image
+
+def main() -> None:
+    """Parse arguments and generate the artwork."""
+    parser = argparse.ArgumentParser(
+        description="Dark academia visionary art with radiant fractal lights."
+    )
+    parser.add_argument("--width", type=int, default=1920, help="Image width in pixels")
+    parser.add_argument("--height", type=int, default=1080, help="Image height in pixels")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="reuse finished renders stored here (one PNG per environment/planet/size "
+        "and renderer version)",
+    )
+    args = parser.parse_args()
+
+    now = datetime.now()
+    env = get_environment(now.hour)
+    planet = PLANETS[now.hour % len(PLANETS)]
+    planet_color = get_planet_color(now.hour)
     output = Path("Visionary_Dream.png")
-    image.save(output)
 
+    # The piece depends only on these inputs and the renderer's source, so a
+    # cached render with the same key can be copied as-is
+    cached = None
+    if args.cache_dir is not None:
+        key = f"{env}-{planet}-{args.width}x{args.height}-{renderer_digest()}"
+        cached = args.cache_dir / f"{key}.png"
+        if cached.exists():
+            shutil.copyfile(cached, output)
+            return
+
+    image = render(args.width, args.height, env, planet_color)
+
+    # Save image
+    image.save(output)
+    if cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output, cached)
 
 if __name__ == "__main__":
     main()
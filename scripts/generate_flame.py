@@ -15,7 +15,7 @@ Dependencies:
 Usage (single):
   python3 scripts/generate_flame.py flame --out assets/flame/flame.png
 
-Batch (N variants):
+Batch (N variants, rendered in parallel across CPU cores; --workers 1 for serial):
   python3 scripts/generate_flame.py batch --out assets/flame --count 6 --width 1920 --height 1920
 
 Atlas from a folder:
@@ -43,6 +43,7 @@ import math
 import os
 import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Sequence, Tuple
@@ -355,24 +356,39 @@ def cmd_flame(args: argparse.Namespace) -> None:
     save_png_optimized(img, Path(args.out), palette=args.palette_size, dither=not args.no_dither)
 
 
+def _render_batch_item(job: Tuple[argparse.Namespace, int, str, Path]) -> None:
+    # Runs in a worker process: each flame is an independent, GIL-bound loop.
+    args, seed, pk, dest = job
+    img = flame(
+        width=args.width,
+        height=args.height,
+        samples=args.samples,
+        seed=seed,
+        palette_key=pk,
+        gamma=args.gamma,
+        burn_in=args.burn_in,
+        transforms=args.transforms,
+    )
+    save_png_optimized(img, dest, palette=args.palette_size, dither=not args.no_dither)
+
+
 def cmd_batch(args: argparse.Namespace) -> None:
     outdir = Path(args.out or args.root or "assets/flame")
     outdir.mkdir(parents=True, exist_ok=True)
+    # Draw seeds/palettes up front so the output set does not depend on worker count.
+    jobs = []
     for i in range(args.count):
         seed = (args.seed + i) if args.seed is not None else random.randrange(2**30)
         pk = args.palette if args.palette != "auto" else random.choice(list(STYLEPACKS.keys()))
-        img = flame(
-            width=args.width,
-            height=args.height,
-            samples=args.samples,
-            seed=seed,
-            palette_key=pk,
-            gamma=args.gamma,
-            burn_in=args.burn_in,
-            transforms=args.transforms,
-        )
         name = f"flame_{i:02d}_{pk}_s{seed}.png"
-        save_png_optimized(img, outdir / name, palette=args.palette_size, dither=not args.no_dither)
+        jobs.append((args, seed, pk, outdir / name))
+    workers = getattr(args, "workers", None) or min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        for job in jobs:
+            _render_batch_item(job)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_render_batch_item, jobs))
 
 
 def cmd_atlas(args: argparse.Namespace) -> None:
@@ -426,6 +442,7 @@ def cmd_all(args: argparse.Namespace) -> None:
         burn_in=args.burn_in,
         transforms=args.transforms,
         no_dither=args.no_dither,
+        workers=args.workers,
     )
     cmd_batch(bargs)
     # 2) atlas
@@ -474,6 +491,7 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--out", help="output directory (default = --root)")
     sp.add_argument("--root", help="alias of out directory (compat)", default="assets/flame")
     sp.add_argument("--count", type=int, default=6, help="number of variants")
+    sp.add_argument("--workers", type=int, default=None, help="parallel render processes (default = CPU count)")
     sp.set_defaults(func=cmd_batch)
 
     # atlas
@@ -500,6 +518,7 @@ def build_parser() -> argparse.ArgumentParser:
     sp = add_common(sub.add_parser("all", help="batch → atlas → thumbs → manifest"))
     sp.add_argument("--root", default="assets/flame", help="root/output folder")
     sp.add_argument("--count", type=int, default=6, help="batch count")
+    sp.add_argument("--workers", type=int, default=None, help="parallel render processes (default = CPU count)")
     sp.add_argument("--cols", type=int, default=None, help="atlas columns")
     sp.add_argument("--thumb-size", type=int, default=512, help="gallery thumb size")
     sp.set_defaults(func=cmd_all)
@@ -15,10 +15,12 @@ from __future__ import annotations
 
 import argparse
 import math
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
-from PIL import Image, ImageDraw, ImageColor
+import numpy as np
+from PIL import Image, ImageDraw, ImageColor, ImageOps
 
 # ---------------------------------------------------------------------------
 # Color palettes inspired by esoteric dark academia and visionary art
@@ -37,17 +39,14 @@ def hex_to_rgb(value: str) -> tuple[int, int, int]:
     return ImageColor.getrgb(value)
 
 
-def vertical_gradient(draw: ImageDraw.ImageDraw, width: int, height: int,
-                      top: str, bottom: str) -> None:
-    """Render a vertical gradient background."""
-    top_rgb = hex_to_rgb(top)
-    bottom_rgb = hex_to_rgb(bottom)
-    for y in range(height):
-        t = y / height
-        r = int(top_rgb[0] * (1 - t) + bottom_rgb[0] * t)
-        g = int(top_rgb[1] * (1 - t) + bottom_rgb[1] * t)
-        b = int(top_rgb[2] * (1 - t) + bottom_rgb[2] * t)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+def vertical_gradient(img: Image.Image, top: str, bottom: str) -> None:
+    """Render a vertical gradient background.
+
+    Pillow's built-in 256-step ramp is stretched with its C resampler and
+    colorized, so no per-row Python work is needed.
+    """
+    ramp = Image.linear_gradient("L").resize(img.size, Image.Resampling.BILINEAR)
+    img.paste(ImageOps.colorize(ramp, hex_to_rgb(top), hex_to_rgb(bottom)))
 
 
 def indra_net(draw: ImageDraw.ImageDraw, width: int, height: int,
@@ -74,22 +73,43 @@ def indra_net(draw: ImageDraw.ImageDraw, width: int, height: int,
         draw.ellipse([(x - 6, y - 6), (x + 6, y + 6)], fill=node_color)
 
 
-def phyllotaxis(draw: ImageDraw.ImageDraw, width: int, height: int,
-                points: int = 600, turns: float = 5.0) -> None:
+@lru_cache(maxsize=None)
+def orb_stamp(size: int) -> np.ndarray:
+    """Rasterize a filled disc of radius ``size`` once and reuse it as a mask."""
+    mask = Image.new("L", (2 * size + 1, 2 * size + 1), 0)
+    ImageDraw.Draw(mask).ellipse([(0, 0), (2 * size, 2 * size)], fill=255)
+    return np.asarray(mask) > 0
+
+
+def blit_stamp(buf: np.ndarray, mask: np.ndarray, x0: int, y0: int,
+               color: tuple[int, int, int]) -> None:
+    """Write ``color`` into ``buf`` wherever ``mask`` is set, clipped to the canvas."""
+    h, w = mask.shape
+    top, left = max(y0, 0), max(x0, 0)
+    bottom, right = min(y0 + h, buf.shape[0]), min(x0 + w, buf.shape[1])
+    if top >= bottom or left >= right:
+        return
+    m = mask[top - y0:bottom - y0, left - x0:right - x0]
+    buf[top:bottom, left:right][m] = color
+
+
+def phyllotaxis(img: Image.Image, points: int = 600, turns: float = 5.0) -> None:
     """Overlay a phyllotactic spiral for spiral learning symbolism."""
+    width, height = img.size
     cx, cy = width // 2, height // 2
     max_radius = min(cx, cy) * 0.75
-    golden_angle = math.pi * (3 - math.sqrt(5))
-    colors = [PALETTE["wine"], PALETTE["gold"], PALETTE["sage"]]
-    for i in range(points):
-        t = i / points
-        angle = turns * 2 * math.pi * t
-        radius = max_radius * t
-        x = cx + radius * math.cos(angle)
-        y = cy + radius * math.sin(angle)
-        color = hex_to_rgb(colors[i % len(colors)])
-        size = 2 + int(4 * t)
-        draw.ellipse([(x - size, y - size), (x + size, y + size)], fill=color)
+    colors = [hex_to_rgb(PALETTE[k]) for k in ("wine", "gold", "sage")]
+    t = np.arange(points) / points
+    angle = turns * 2 * math.pi * t
+    radius = max_radius * t
+    sizes = 2 + (4 * t).astype(np.int32)
+    # Top-left corner of each orb's stamp, then blit straight into the pixels
+    x0 = (np.rint(cx + radius * np.cos(angle)).astype(np.int32) - sizes).tolist()
+    y0 = (np.rint(cy + radius * np.sin(angle)).astype(np.int32) - sizes).tolist()
+    buf = np.array(img)
+    for i, size in enumerate(sizes.tolist()):
+        blit_stamp(buf, orb_stamp(size), x0[i], y0[i], colors[i % len(colors)])
+    img.paste(Image.fromarray(buf, img.mode))
 
 
 def generate(width: int, height: int, output: Path) -> None:
@@ -98,13 +118,13 @@ def generate(width: int, height: int, output: Path) -> None:
     draw = ImageDraw.Draw(img, "RGBA")
 
     # Layer 1: parchment-to-ink gradient
-    vertical_gradient(draw, width, height, PALETTE["parchment"], PALETTE["ink"])
+    vertical_gradient(img, PALETTE["parchment"], PALETTE["ink"])
 
     # Layer 2: Indra net lattice
     indra_net(draw, width, height)
 
     # Layer 3: phyllotactic spiral overlay
-    phyllotaxis(draw, width, height)
+    phyllotaxis(img)
 
     img.save(output)
 
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Render every top-level ``visionary_*.py`` generator in one batch.
+
+Each generator writes ``Visionary_Dream*.png`` into its working directory,
+so every one runs in its own output folder (``<out>/<script name>/``) and
+no render clobbers another. The generators are independent CPU-bound
+processes, so they run side by side, one per core by default.
+
+Usage:
+    python3 scripts/render_all.py                      # every generator
+    python3 scripts/render_all.py visionary_monad visionary_pathways
+    python3 scripts/render_all.py --out exports/visionary --workers 2
+    python3 scripts/render_all.py --fast               # zlib level 1 previews
+
+Every generator saves through ``png_options.png_level()``, which reads
+``PNG_LEVEL`` (default 6); ``--fast`` sets it to 1 for quicker, larger
+preview files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Generators run outside the repo root, so repo-relative inputs are passed explicitly
+INPUT_ARGS = {
+    "visionary_resource_links": ["--source", str(REPO_ROOT / "data" / "rooms.json")],
+}
+
+
+def discover() -> List[Path]:
+    """Return the generator scripts at the repository root, sorted by name."""
+    return sorted(REPO_ROOT.glob("visionary_*.py"))
+
+
+def render(job: Tuple[Path, Path, dict]) -> Tuple[str, int, float, str]:
+    """Run one generator inside its output folder; return name, code, seconds, stderr."""
+    script, outdir, env = job
+    outdir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, str(script), *INPUT_ARGS.get(script.stem, [])],
+        cwd=outdir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    return script.stem, proc.returncode, time.perf_counter() - start, proc.stderr
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render all visionary generators in parallel.")
+    parser.add_argument("names", nargs="*", help="generator names to run (default: all)")
+    parser.add_argument("--out", default="exports/visionary", help="root output folder")
+    parser.add_argument("--workers", type=int, default=None, help="parallel renders (default: CPU count)")
+    parser.add_argument("--fast", action="store_true", help="save PNGs with zlib level 1")
+    args = parser.parse_args()
+
+    scripts = discover()
+    if args.names:
+        wanted = {Path(n).stem for n in args.names}
+        scripts = [s for s in scripts if s.stem in wanted]
+        missing = wanted - {s.stem for s in scripts}
+        if missing:
+            parser.error(f"unknown generators: {', '.join(sorted(missing))}")
+
+    out = Path(args.out).resolve()
+    env = dict(os.environ)
+    if args.fast:
+        env["PNG_LEVEL"] = "1"
+    jobs = [(script, out / script.stem, env) for script in scripts]
+    # Each job is a child process; threads only wait on them
+    workers = args.workers or min(len(jobs), os.cpu_count() or 1)
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for name, code, seconds, stderr in pool.map(render, jobs):
+            if code == 0:
+                print(f"✓ {name} ({seconds:.1f}s) → {out / name}")
+            else:
+                failed += 1
+                last = stderr.strip().splitlines()[-1:] or ["no output"]
+                print(f"✗ {name} exited {code}: {last[0]}", file=sys.stderr)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
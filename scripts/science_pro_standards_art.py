@@ -22,29 +22,35 @@ PALETTE = np.array([
     [ 20,  10,  60],  # deep indigo
 ], dtype=np.float32)
 
-# Generate coordinate grids ---------------------------------------------------
-x = np.linspace(-2, 2, WIDTH)
-y = np.linspace(-1.125, 1.125, HEIGHT)
-X, Y = np.meshgrid(x, y)
-
-# Convert to polar coordinates for radial symmetry ---------------------------
-R = np.sqrt(X**2 + Y**2)
-Theta = np.arctan2(Y, X)
-
-# Layered geometric pattern ensuring smooth gradients ------------------------
-pattern = np.sin(6 * Theta + 9 * R) * np.cos(3 * R)
-pattern += np.sin((X**2 - Y**2) * 3)
-
-# Normalize pattern to [0,1] for palette mapping ------------------------------
-pattern_norm = (pattern - pattern.min()) / (pattern.max() - pattern.min())
-
-# Interpolate colors from the palette ----------------------------------------
-idx = pattern_norm * (len(PALETTE) - 1)
-low = np.floor(idx).astype(int)
-high = np.clip(low + 1, 0, len(PALETTE) - 1)
-frac = idx - low
-colors = (1 - frac[..., None]) * PALETTE[low] + frac[..., None] * PALETTE[high]
-colors = np.uint8(colors)
+
+def generate_art() -> Image.Image:
+    """Render the palette-mapped interference pattern and return the image."""
+
+    # Generate coordinate grids -----------------------------------------------
+    x = np.linspace(-2, 2, WIDTH)
+    y = np.linspace(-1.125, 1.125, HEIGHT)
+    X, Y = np.meshgrid(x, y)
+
+    # Convert to polar coordinates for radial symmetry ------------------------
+    R = np.sqrt(X**2 + Y**2)
+    Theta = np.arctan2(Y, X)
+
+    # Layered geometric pattern ensuring smooth gradients ---------------------
+    pattern = np.sin(6 * Theta + 9 * R) * np.cos(3 * R)
+    pattern += np.sin((X**2 - Y**2) * 3)
+
+    # Normalize pattern to [0,1] for palette mapping --------------------------
+    pattern_norm = (pattern - pattern.min()) / (pattern.max() - pattern.min())
+
+    # Interpolate colors from the palette, one np.interp call per channel -----
+    idx = pattern_norm * (len(PALETTE) - 1)
+    stops = np.arange(len(PALETTE))
+    colors = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    for c in range(3):
+        colors[..., c] = np.interp(idx, stops, PALETTE[:, c])
+    return Image.fromarray(colors)
+
 
 # Save final visionary artwork ------------------------------------------------
-Image.fromarray(colors).save("Visionary_Dream.png")
+if __name__ == "__main__":
+    generate_art().save("Visionary_Dream.png")
@@ -8,8 +8,14 @@ The image is saved as ``Visionary_Dream.png``.
 from math import cos, sin, pi, exp
 from pathlib import Path
 import json
+import numpy as np
 from PIL import Image, ImageDraw
 
+try:  # optional JIT for the spiral point generator
+    from numba import njit
+except ImportError:  # pragma: no cover - numba not installed
+    njit = None
+
 # Canvas resolution (portrait tarot ratio)
 WIDTH, HEIGHT = 1024, 1536
 
@@ -21,49 +27,67 @@ with (DATA_DIR / "palette.json").open() as f:
     _pal = json.load(f)["fuchs_palette"]
 PALETTE = [tuple(_pal[name]) for name in ("gold", "violet", "turquoise", "sapphire")]
 
-def gradient_background(draw: ImageDraw.ImageDraw) -> None:
-    """Lay down a vertical gradient bridging gold and violet."""
-    for y in range(HEIGHT):
-        t = y / HEIGHT
-        r = int(PALETTE[0][0] * (1 - t) + PALETTE[1][0] * t)
-        g = int(PALETTE[0][1] * (1 - t) + PALETTE[1][1] * t)
-        b = int(PALETTE[0][2] * (1 - t) + PALETTE[1][2] * t)
-        draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
+def gradient_background() -> Image.Image:
+    """Return the canvas, born directly from a gold-to-violet gradient array."""
+    t = (np.arange(HEIGHT) / HEIGHT)[:, None]
+    col = (np.array(PALETTE[0]) * (1 - t) + np.array(PALETTE[1]) * t).astype(np.uint8)
+    canvas = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    canvas[:] = col[:, None, :]
+    return Image.fromarray(canvas, "RGB")
+
+# Unit square corners, computed once; each tesseract layer only rotates them
+UNIT_SQUARE = np.array([(cos(j * pi / 2), sin(j * pi / 2)) for j in range(4)])
+
 
 def draw_tesseract(draw: ImageDraw.ImageDraw) -> None:
     """Render nested, rotated squares evoking a tesseract portal."""
-    cx, cy = WIDTH // 2, HEIGHT // 2
+    center = np.array([WIDTH // 2, HEIGHT // 2])
     base = min(WIDTH, HEIGHT) * 0.35
     for i in range(5):
         scale = base * (1 - i * 0.15)
-        angle = pi / 4 * i
-        points = []
-        for j in range(4):
-            theta = angle + j * pi / 2
-            x = cx + scale * cos(theta)
-            y = cy + scale * sin(theta)
-            points.append((x, y))
+        c, s = cos(pi / 4 * i), sin(pi / 4 * i)
+        rot = np.array([[c, s], [-s, c]])
+        points = (center + scale * (UNIT_SQUARE @ rot)).tolist()
         draw.polygon(points, outline=PALETTE[2])
 
+
+def _log_spiral_numpy(cx: float, cy: float, a: float, b: float,
+                      theta_max: float, step: float) -> np.ndarray:
+    """Return ``(n, 2)`` points of ``r = a * exp(b * theta)`` up to ``theta_max``."""
+    theta = np.arange(int(np.ceil(theta_max / step))) * step
+    r = a * np.exp(b * theta)
+    return np.column_stack([cx + r * np.cos(theta), cy + r * np.sin(theta)])
+
+
+def _log_spiral_loop(cx: float, cy: float, a: float, b: float,
+                     theta_max: float, step: float) -> np.ndarray:
+    """Scalar loop form of :func:`_log_spiral_numpy`, written for Numba."""
+    n = int(np.ceil(theta_max / step))
+    out = np.empty((n, 2))
+    theta = 0.0
+    for i in range(n):
+        r = a * exp(b * theta)
+        out[i, 0] = cx + r * cos(theta)
+        out[i, 1] = cy + r * sin(theta)
+        theta += step
+    return out
+
+
+# Numba compiles the loop to machine code; NumPy is the fallback path.
+_log_spiral = njit(cache=True)(_log_spiral_loop) if njit else _log_spiral_numpy
+
+
 def draw_spiral(draw: ImageDraw.ImageDraw) -> None:
     """Trace a logarithmic spiral echoing cathedral arches."""
     cx, cy = WIDTH // 2, HEIGHT // 2
-    a, b = 2, 0.20
-    theta = 0.0
-    last = (cx, cy)
-    while theta < 12 * pi:
-        r = a * exp(b * theta)
-        x = cx + r * cos(theta)
-        y = cy + r * sin(theta)
-        draw.line([last, (x, y)], fill=PALETTE[3], width=2)
-        last = (x, y)
-        theta += pi / 32
+    pts = _log_spiral(cx, cy, 2.0, 0.20, 12 * pi, pi / 32)
+    path = [(cx, cy)] + [tuple(p) for p in pts.tolist()]
+    draw.line(path, fill=PALETTE[3], width=2)
 
 def main() -> None:
     """Compose the visionary dream and save it to disk."""
-    img = Image.new("RGB", (WIDTH, HEIGHT), "black")
+    img = gradient_background()
     draw = ImageDraw.Draw(img)
-    gradient_background(draw)
     draw_tesseract(draw)
     draw_spiral(draw)
     ASSETS_DIR.mkdir(parents=True, exist_ok=True)
@@ -1,15 +1,12 @@
-\
-"""Visionary geometry rendered with Python and Matplotlib.
-
 """Visionary geometry rendered with pure Python.
 
 Produces a museum-quality mandala using an Alex Grey-inspired palette.
+The per-pixel kernel uses the compiled ``_pixels`` extension when it has
+been built (see ``_pixels.pyx``), a parallel Numba JIT of the same loop or
+a broadcast NumPy version when those are importable, and pure Python
+otherwise.
 """
 
-# Imports and setup
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
 # Import standard libraries
 import argparse
 import math
@@ -17,31 +14,25 @@ import struct
 import zlib
 from typing import Tuple
 
-# Canvas dimensions for a gallery-grade piece
-WIDTH, HEIGHT = 1920, 1080
+try:  # optional AOT-compiled kernel
+    from _pixels import generate_pixels as _compiled_generate_pixels
+except ImportError:  # pragma: no cover - extension not built
+    _compiled_generate_pixels = None
 
-# Generating a radial grid to evoke psychedelic mandalas
-a = np.linspace(-2 * np.pi, 2 * np.pi, WIDTH)
-b = np.linspace(-2 * np.pi, 2 * np.pi, HEIGHT)
-X, Y = np.meshgrid(a, b)
+try:  # optional whole-array path when NumPy happens to be installed
+    import numpy as np
+except ImportError:  # pragma: no cover - stay dependency-free
+    np = None
 
-# Layered wave interference pattern to form visionary symmetry
-Z = np.sin(X**2 + Y**2) + np.cos(3 * X) * np.sin(3 * Y)
-Z_norm = (Z - Z.min()) / (Z.max() - Z.min())
+try:  # optional multi-threaded JIT of the per-pixel loop
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba not installed
+    njit = None
+    prange = range
 
-# Color palette inspired by Alex Grey's luminous mysticism
-colors = ["#1a237e", "#d500f9", "#ff6d00", "#00e5ff", "#76ff03"]
-cmap = LinearSegmentedColormap.from_list("alex_grey_palette", colors)
-
-# Rendering the canvas with curvature and symmetry
-plt.figure(figsize=(WIDTH / 100, HEIGHT / 100), dpi=100)
-plt.axis("off")
-plt.imshow(Z_norm, cmap=cmap)
+# Canvas dimensions for a gallery-grade piece
+WIDTH, HEIGHT = 1920, 1080
 
-# Saving the final artifact
-plt.tight_layout(pad=0)
-plt.savefig("Visionary_Dream.png", dpi=100, bbox_inches="tight", pad_inches=0)
-plt.close()
 # Alex Grey-inspired color palette
 PALETTE = [
     "#1a237e",  # deep indigo
@@ -53,7 +44,6 @@ PALETTE = [
 
 
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-def hex_to_rgb(hex_color: str) -> tuple:
     """Convert a hex color string to an RGB tuple."""
     hex_color = hex_color.lstrip("#")
     return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
@@ -62,25 +52,68 @@ def hex_to_rgb(hex_color: str) -> tuple:
 PALETTE_RGB = [hex_to_rgb(c) for c in PALETTE]
 
 
-def interpolate(c1: Tuple[int, int, int], c2: Tuple[int, int, int], t: float) -> Tuple[int, int, int]:
-def interpolate(c1: tuple, c2: tuple, t: float) -> tuple:
-    """Linearly interpolate between two RGB colors."""
-    return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3))
-
-
 def palette_color(v: float) -> Tuple[int, int, int]:
-def palette_color(v: float) -> tuple:
     """Map a 0-1 value to the Alex Grey-inspired palette."""
     seg = v * (len(PALETTE_RGB) - 1)
     i = int(seg)
     t = seg - i
-    c1 = PALETTE_RGB[i]
-    c2 = PALETTE_RGB[min(i + 1, len(PALETTE_RGB) - 1)]
-    return interpolate(c1, c2, t)
+    r1, g1, b1 = PALETTE_RGB[i]
+    r2, g2, b2 = PALETTE_RGB[min(i + 1, len(PALETTE_RGB) - 1)]
+    # Interpolation inlined: this runs once per pixel in the fallback path
+    return (int(r1 + (r2 - r1) * t), int(g1 + (g2 - g1) * t), int(b1 + (b2 - b1) * t))
+
+
+def _numpy_generate_pixels(width: int, height: int) -> bytearray:
+    """Broadcast version of the per-pixel kernel below."""
+    cx, cy = width / 2, height / 2
+    nx = ((np.arange(width) - cx) / cx)[None, :]
+    ny = ((np.arange(height) - cy) / cy)[:, None]
+    v = (np.sin(10 * np.hypot(nx, ny) + 5 * np.arctan2(ny, nx)) + 1) / 2
+    seg = v * (len(PALETTE_RGB) - 1)
+    i = seg.astype(np.int64)
+    t = (seg - i)[..., None]
+    pal = np.array(PALETTE_RGB, dtype=np.float64)
+    c1 = pal[i]
+    c2 = pal[np.minimum(i + 1, len(PALETTE_RGB) - 1)]
+    out = np.full((height, width, 4), 255, dtype=np.uint8)
+    out[..., :3] = (c1 + (c2 - c1) * t).astype(np.uint8)
+    return bytearray(out.tobytes())
+
+
+def _fill_pixels_loop(out, pal) -> None:
+    """Fill an ``(H, W, 4)`` uint8 array; written for Numba, rows run in parallel."""
+    height, width = out.shape[0], out.shape[1]
+    cx, cy = width / 2, height / 2
+    last = pal.shape[0] - 1
+    for y in prange(height):
+        ny = (y - cy) / cy
+        for x in range(width):
+            nx = (x - cx) / cx
+            v = (math.sin(10 * math.hypot(nx, ny) + 5 * math.atan2(ny, nx)) + 1) / 2
+            seg = v * last
+            i = int(seg)
+            j = min(i + 1, last)
+            t = seg - i
+            for c in range(3):
+                out[y, x, c] = int(pal[i, c] + (pal[j, c] - pal[i, c]) * t)
+            out[y, x, 3] = 255
+
+
+_jit_fill_pixels = (
+    njit(parallel=True, fastmath=True, cache=True)(_fill_pixels_loop) if njit else None
+)
 
 
 def generate_pixels(width: int, height: int) -> bytearray:
     """Generate pixel data for the visionary mandala."""
+    if _compiled_generate_pixels is not None:
+        return _compiled_generate_pixels(width, height)
+    if _jit_fill_pixels is not None:
+        out = np.empty((height, width, 4), dtype=np.uint8)
+        _jit_fill_pixels(out, np.array(PALETTE_RGB, dtype=np.float64))
+        return bytearray(out.tobytes())
+    if np is not None:
+        return _numpy_generate_pixels(width, height)
     pixels = bytearray(width * height * 4)
     cx, cy = width / 2, height / 2
     for y in range(height):
@@ -125,11 +158,6 @@ def main() -> None:
         description="Render visionary geometry without Pillow or NumPy."
     )
     parser.add_argument("--width", type=int, default=WIDTH, help="Image width in pixels")
-    parser.add_argument(
-        "--height", type=int, default=HEIGHT, help="Image height in pixels"
-    )
-    parser = argparse.ArgumentParser(description="Render visionary geometry without Pillow or NumPy.")
-    parser.add_argument("--width", type=int, default=WIDTH, help="Image width in pixels")
     parser.add_argument("--height", type=int, default=HEIGHT, help="Image height in pixels")
     args = parser.parse_args()
 
@@ -0,0 +1,61 @@
+"""render_all runs each generator in its own folder and forwards PNG_LEVEL."""
+
+import sys
+
+import pytest
+
+import render_all
+
+# Stand-in generator: records the compression level it was given in its cwd
+FAKE_GENERATOR = """
+import os, pathlib
+pathlib.Path("level.txt").write_text(os.environ.get("PNG_LEVEL", "unset"))
+"""
+
+
+@pytest.fixture
+def fake_repo(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for name in ("visionary_alpha", "visionary_beta", "visionary_gamma"):
+        (repo / f"{name}.py").write_text(FAKE_GENERATOR)
+    (repo / "helper.py").write_text("raise SystemExit('not a generator')\n")
+    monkeypatch.setattr(render_all, "REPO_ROOT", repo)
+    return repo
+
+
+def run(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["render_all.py", *args])
+    render_all.main()
+
+
+def test_fast_renders_every_generator_at_level_1(fake_repo, tmp_path, monkeypatch):
+    monkeypatch.setenv("PNG_LEVEL", "9")
+    out = tmp_path / "out"
+    run(monkeypatch, "--fast", "--out", str(out), "--workers", "2")
+
+    assert sorted(p.name for p in out.iterdir()) == [
+        "visionary_alpha", "visionary_beta", "visionary_gamma",
+    ]
+    for folder in out.iterdir():
+        assert (folder / "level.txt").read_text() == "1"
+
+
+def test_png_level_is_inherited_without_fast(fake_repo, tmp_path, monkeypatch):
+    monkeypatch.setenv("PNG_LEVEL", "9")
+    out = tmp_path / "out"
+    run(monkeypatch, "visionary_beta", "--out", str(out))
+
+    assert [p.name for p in out.iterdir()] == ["visionary_beta"]
+    assert (out / "visionary_beta" / "level.txt").read_text() == "9"
+
+
+def test_failed_generator_exits_nonzero(fake_repo, tmp_path, monkeypatch, capsys):
+    (fake_repo / "visionary_beta.py").write_text("raise SystemExit('boom')\n")
+    out = tmp_path / "out"
+    with pytest.raises(SystemExit) as exc:
+        run(monkeypatch, "--out", str(out))
+
+    assert exc.value.code == 1
+    assert "visionary_beta exited 1: boom" in capsys.readouterr().err
+    assert (out / "visionary_alpha" / "level.txt").exists()
@@ -0,0 +1,22 @@
+"""The fractal's escape-time backends must agree pixel for pixel."""
+
+import numpy as np
+
+import visionary_fractal
+
+
+def test_backends_agree_on_small_grid():
+    xs = np.linspace(-1.8, 1.8, 96)
+    ys = np.linspace(-1.0, 1.0, 54)
+    c = np.exp(1j * np.pi / 4) * 0.7885
+
+    # The undecorated per-pixel loop is the reference for both backends
+    expected = np.zeros((len(ys), len(xs)))
+    visionary_fractal._escape_loop(expected, xs, ys, c, 300, 12)
+
+    np.testing.assert_array_equal(
+        visionary_fractal._escape_numpy(xs, ys, c, 300, 12), expected
+    )
+    np.testing.assert_array_equal(
+        visionary_fractal.escape_times(xs, ys, c, 300, 12), expected
+    )
@@ -0,0 +1,23 @@
+"""palette_map clamps fields that stray outside [0, 1]."""
+
+import importlib.util
+
+import numpy as np
+
+from conftest import ROOT
+
+_spec = importlib.util.spec_from_file_location(
+    "visionary_palette", ROOT / "app" / "engines" / "visionary_palette.py"
+)
+visionary_palette = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(visionary_palette)
+
+
+def test_palette_map_clamps_out_of_range_values():
+    palette = [(0.0, 0.0, 0.0), (0.5, 0.25, 1.0), (1.0, 1.0, 1.0)]
+    values = np.array([[-0.3, 0.0, 1.0, 1.2]])
+    out = visionary_palette.palette_map(values, palette)
+    np.testing.assert_allclose(out[0, 0], palette[0])
+    np.testing.assert_allclose(out[0, 1], palette[0])
+    np.testing.assert_allclose(out[0, 2], palette[-1])
+    np.testing.assert_allclose(out[0, 3], palette[-1])
@@ -0,0 +1,85 @@
+"""collect_links walks quests in order; load_links parses or streams them alike."""
+
+import json
+
+import pytest
+
+import visionary_resource_links as resource_links
+
+
+def _quests(rooms):
+    """Return a quest document with ``rooms`` rooms of nested links."""
+    return {
+        "link": "https://example.org/root",
+        "rooms": [
+            {
+                "name": f"room {i}",
+                "link": f"https://example.org/rooms/{i}",
+                "notes": ["not a link", {"link": f"https://example.org/notes/{i}"}],
+                "doors": {"north": {"link": 7}, "south": {"link": [f"https://example.org/x/{i}"]}},
+                "x.link": f"https://example.org/dotted/{i}",
+                "meta": {"a.link": {"b": "not a link either"}},
+            }
+            for i in range(rooms)
+        ],
+    }
+
+
+def _expected(doc):
+    links = ["https://example.org/root"]
+    for i in range(len(doc["rooms"])):
+        links += [f"https://example.org/rooms/{i}", f"https://example.org/notes/{i}"]
+    return links
+
+
+def test_small_file_is_parsed_whole(tmp_path):
+    doc = _quests(3)
+    source = tmp_path / "rooms.json"
+    source.write_text(json.dumps(doc))
+    assert source.stat().st_size < resource_links.STREAM_THRESHOLD
+
+    links = resource_links.load_links(source)
+    assert links == _expected(doc)
+    assert all(isinstance(link, str) for link in links)
+
+
+def test_large_file_streams_to_the_same_links(tmp_path, monkeypatch):
+    pytest.importorskip("ijson")
+    doc = _quests(2000)
+    source = tmp_path / "rooms.json"
+    source.write_text(json.dumps(doc))
+    assert source.stat().st_size >= resource_links.STREAM_THRESHOLD
+
+    streamed = resource_links.load_links(source)
+    monkeypatch.setattr(resource_links, "ijson", None)
+    parsed = resource_links.load_links(source)
+
+    assert type(streamed) is type(parsed) is list
+    assert all(type(link) is str for link in streamed)
+    assert streamed == parsed == _expected(doc)
+
+
+def test_collect_links_keeps_document_order():
+    doc = [
+        {"link": "a", "rooms": [{"link": "b"}, {"inner": {"link": "c"}}]},
+        {"title": "no link here", "link": None},
+        ["stray string", {"link": "d"}],
+        {"link": "e"},
+    ]
+    assert resource_links.collect_links(doc) == ["a", "b", "c", "d", "e"]
+
+
+def test_collect_links_ignores_scalars_and_non_string_links():
+    assert resource_links.collect_links("https://example.org") == []
+    assert resource_links.collect_links({"link": 3, "url": "x", "rooms": ["y"]}) == []
+
+
+def test_collect_links_handles_deep_nesting():
+    depth = 5000
+    node = {"link": "bottom"}
+    for level in range(depth):
+        node = {"link": f"level {level}", "room": [node]}
+    links = resource_links.collect_links(node)
+    assert len(links) == depth + 1
+    assert links[0] == f"level {depth - 1}"
+    assert links[-1] == "bottom"
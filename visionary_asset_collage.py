@@ -3,6 +3,10 @@
 Combines provided art assets into a surreal mandala. The piece uses a
 color palette inspired by Alex Grey and surrealism. The final image is
 rendered at 4096x4096 resolution and saved as ``Visionary_Dream.png``.
+
+Rotation uses bilinear resampling; installing Pillow-SIMD
+(``pip install pillow-simd``) swaps in its AVX2 resample kernels with no
+code changes.
 """
 
 # Imports and setup ---------------------------------------------------------
@@ -11,7 +15,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List
 
-from PIL import Image, ImageOps, ImageEnhance, ImageDraw
+import numpy as np
+from PIL import Image, ImageColor, ImageOps, ImageEnhance, ImageDraw
+
+from png_options import png_level
 
 # Color palette inspired by Alex Grey & surrealism -------------------------
 PALETTE: List[str] = [
@@ -33,32 +40,41 @@ ASSET_FILES: List[str] = [
 ]
 
 WIDTH, HEIGHT = 4096, 4096
+OVERLAY_ALPHA = 0x40  # ring opacity out of 255
 
 
 def load_assets() -> List[Image.Image]:
-    """Load all existing asset images."""
+    """Load all existing asset images, fitted and color-boosted once."""
 
     images: List[Image.Image] = []
     for file in ASSET_FILES:
         path = Path(file)
         if path.exists():
-            img = Image.open(path).convert("RGBA")
+            # Decode once; convert() forces the load so rotations reuse pixels
+            with Image.open(path) as src:
+                img = src.convert("RGBA")
+
+            # Fit asset within the canvas
+            img = ImageOps.contain(img, (WIDTH, HEIGHT))
+
+            # Boost color intensity for visionary glow
+            img = ImageEnhance.Color(img).enhance(1.4)
             images.append(img)
     return images
 
 
 def composite_assets(canvas: Image.Image, assets: List[Image.Image]) -> None:
-    """Layer assets with rotational symmetry."""
+    """Layer prepared assets with rotational symmetry."""
 
+    step = 360.0 / max(len(assets), 1)
     for index, img in enumerate(assets):
-        # Fit asset within the canvas
-        img = ImageOps.contain(img, (WIDTH, HEIGHT))
-
-        # Rotate for radial symmetry
-        img = img.rotate(index * (360 / max(len(assets), 1)), expand=True)
-
-        # Boost color intensity for visionary glow
-        img = ImageEnhance.Color(img).enhance(1.4)
+        # Rotate for radial symmetry (bilinear, transparent corners)
+        img = img.rotate(
+            index * step,
+            resample=Image.Resampling.BILINEAR,
+            expand=True,
+            fillcolor=(0, 0, 0, 0),
+        )
 
         # Center and merge
         x = (WIDTH - img.width) // 2
@@ -67,15 +83,30 @@ def composite_assets(canvas: Image.Image, assets: List[Image.Image]) -> None:
 
 
 def add_geometric_overlay(canvas: Image.Image) -> None:
-    """Overlay concentric circles using the palette."""
+    """Overlay concentric circles using the palette.
 
-    draw = ImageDraw.Draw(canvas, "RGBA")
+    The rings are rasterized once into a palette-index mask and then blended
+    onto the canvas with uint16 fixed-point arithmetic, keeping its alpha.
+    """
+
+    mask = Image.new("L", canvas.size, 0)
+    draw = ImageDraw.Draw(mask)
     cx, cy = WIDTH // 2, HEIGHT // 2
     max_radius = min(cx, cy)
 
     for i in range(0, max_radius, 40):
-        color = PALETTE[i // 40 % len(PALETTE)] + "40"  # add alpha
-        draw.ellipse([(cx - i, cy - i), (cx + i, cy + i)], outline=color, width=3)
+        index = i // 40 % len(PALETTE) + 1  # 0 marks untouched pixels
+        draw.ellipse([(cx - i, cy - i), (cx + i, cy + i)], outline=index, width=3)
+
+    idx = np.asarray(mask)
+    hit = idx > 0
+    colors = np.array([(0, 0, 0)] + [ImageColor.getrgb(c) for c in PALETTE], np.uint16)
+    arr = np.array(canvas)
+    rgb = arr[..., :3]
+    # v carries a +128 bias, so (v + (v >> 8)) >> 8 is x / 255 rounded, in uint16
+    v = rgb[hit].astype(np.uint16) * (255 - OVERLAY_ALPHA) + colors[idx[hit]] * OVERLAY_ALPHA + 128
+    rgb[hit] = ((v + (v >> 8)) >> 8).astype(np.uint8)
+    canvas.paste(Image.fromarray(arr, "RGBA"))
 
 
 def main() -> None:
@@ -85,7 +116,7 @@ def main() -> None:
     assets = load_assets()
     composite_assets(canvas, assets)
     add_geometric_overlay(canvas)
-    canvas.save("Visionary_Dream.png")
+    canvas.save("Visionary_Dream.png", compress_level=png_level())
     print("Art saved to Visionary_Dream.png")
 
 
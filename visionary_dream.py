@@ -1,25 +1,39 @@
+#!/usr/bin/env python3
 """Visionary Dream Generator.
 
 Creates a museum-quality piece of visionary art inspired by the
-psychedelic palettes of Alex Grey. The image is rendered at 2048x2048
-resolution and saved as ``Visionary_Dream.png``.
-
-Characters depicted: Rebecca Respawn, Virelai, Ezra Lux,
-Athena (Sophia7) and Thoth (Gnosis7) as twin-flame servitors.
+psychedelic palettes of Alex Grey and saves it as ``Visionary_Dream.png``.
+Two styles share this module:
+
+* ``spiral`` (default, 2048x2048): translucent spiral with the characters
+  Rebecca Respawn, Virelai, Ezra Lux, Athena (Sophia7) and Thoth (Gnosis7)
+  as twin-flame servitors.
+* ``igni`` (1024x1024): mandala halos, the IGNI Raku Reiki Dragon fiery
+  spiral and star sparks over an indigo gradient.
 """
-#!/usr/bin/env python3
-"""Generate a museum-quality visionary artwork using Pillow."""
 
 # Imports and setup ---------------------------------------------------------
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import argparse
 import math
-from typing import List
+from typing import Callable, Dict, List
 
+import numpy as np
+import PIL
 from PIL import Image, ImageDraw, ImageColor, ImageFont
 
+from mandala import vertical_gradient
+from png_options import png_level
+
+try:  # optional OpenCV rasterizer for the spiral style (opt-in via --opencv)
+    import cv2
+except ImportError:  # pragma: no cover - opencv-python not installed
+    cv2 = None
+
 
 # Color palette inspired by Alex Grey ---------------------------------------
 PALETTE: List[str] = [
@@ -32,75 +46,351 @@ PALETTE: List[str] = [
 ]
 
 
+@lru_cache(maxsize=None)
 def hex_to_rgba(color: str, alpha: int = 255) -> tuple[int, int, int, int]:
-    """Convert a hex color to an RGBA tuple."""
+    """Convert a hex color to an RGBA tuple (memoized)."""
 
     r, g, b = ImageColor.getrgb(color)
     return (r, g, b, alpha)
 
 
+# Palette pre-parsed once at import for the spiral's hot loops
+PALETTE_RGB = tuple(ImageColor.getrgb(c) for c in PALETTE)
+PALETTE_RGBA180 = tuple(c + (180,) for c in PALETTE_RGB)
+PALETTE_RGBA100 = tuple(c + (100,) for c in PALETTE_RGB)
+
+
 # Core rendering ------------------------------------------------------------
-def draw_spiral(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
-    """Draw a translucent spiral using the Alex Grey palette."""
+Orb = tuple[float, float, int, int]
+Ray = tuple[float, float, float, float, int]
+
+
+def spiral_geometry(width: int, height: int) -> tuple[list[Orb], list[Ray]]:
+    """Return the spiral orbs ``(x, y, size, color)`` and rays ``(x0, y0, x1, y1, color)``.
+
+    Colors are palette indices; both rasterizers share this layout.
+    Coordinates are snapped to whole pixels so that tiles rendered with
+    shifted origins rasterize exactly like the full canvas.
+    """
 
     cx, cy = width / 2, height / 2
     max_radius = min(cx, cy) * 0.95
 
-    for i in range(720):
-        angle = i * math.pi / 180
-        radius = max_radius * i / 720
-        x = cx + math.cos(angle) * radius
-        y = cy + math.sin(angle) * radius
-        color = hex_to_rgba(PALETTE[i % len(PALETTE)], 180)
-        size = 8 + (i % 12)
-        draw.ellipse([(x - size, y - size), (x + size, y + size)], fill=color)
+    # Orb centers, sizes and colors computed in one vectorized pass
+    i = np.arange(720)
+    angle = np.deg2rad(i)
+    radius = max_radius * i / 720
+    orbs = list(zip(
+        np.rint(cx + np.cos(angle) * radius).tolist(),
+        np.rint(cy + np.sin(angle) * radius).tolist(),
+        (8 + i % 12).tolist(),
+        (i % len(PALETTE)).tolist(),
+    ))
 
     # Radial symmetry lines
-    for step in range(0, 360, 6):
-        angle = math.radians(step)
-        color = hex_to_rgba(PALETTE[step % len(PALETTE)], 100)
-        x = cx + math.cos(angle) * max_radius
-        y = cy + math.sin(angle) * max_radius
-        draw.line([(cx, cy), (x, y)], fill=color, width=3)
+    step = np.arange(0, 360, 6)
+    a = np.radians(step)
+    cx, cy = round(cx), round(cy)
+    rays = [
+        (cx, cy, x, y, k)
+        for x, y, k in zip(
+            np.rint(cx + np.cos(a) * max_radius).tolist(),
+            np.rint(cy + np.sin(a) * max_radius).tolist(),
+            (step % len(PALETTE)).tolist(),
+        )
+    ]
+
+    return orbs, rays
+
+
+def draw_spiral(draw: ImageDraw.ImageDraw, width: int, height: int,
+                tile: tuple[int, int, int, int] | None = None) -> None:
+    """Draw a translucent spiral using the Alex Grey palette.
+
+    With ``tile=(x, y, w, h)`` only that window of the full ``width`` x
+    ``height`` piece is drawn, onto a canvas the size of the tile.
+    """
+
+    ox, oy, tw, th = tile or (0, 0, width, height)
+
+    def visible(left: float, top: float, right: float, bottom: float) -> bool:
+        return right >= ox - 2 and left <= ox + tw + 2 and bottom >= oy - 2 and top <= oy + th + 2
+
+    orbs, rays = spiral_geometry(width, height)
+    for x, y, size, k in orbs:
+        if visible(x - size, y - size, x + size, y + size):
+            x, y = x - ox, y - oy
+            draw.ellipse([(x - size, y - size), (x + size, y + size)], fill=PALETTE_RGBA180[k])
+    for x0, y0, x1, y1, k in rays:
+        if visible(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)):
+            draw.line([(x0 - ox, y0 - oy), (x1 - ox, y1 - oy)], fill=PALETTE_RGBA100[k], width=3)
+
+
+def render_spiral_tile(spec: tuple[int, int, int, int, int, int]) -> bytes:
+    """Render one ``(width, height, x, y, w, h)`` tile and return its RGB bytes."""
+
+    width, height, x, y, w, h = spec
+    tile = Image.new("RGB", (w, h), "black")
+    draw_spiral(ImageDraw.Draw(tile, "RGBA"), width, height, (x, y, w, h))
+    return tile.tobytes()
+
+
+def _region(canvas: np.ndarray, x0: float, y0: float, x1: float,
+            y1: float) -> tuple[np.ndarray, int, int] | None:
+    """Return ``(view, left, top)`` for a padded, clipped box, or ``None`` if empty."""
+
+    h, w = canvas.shape[:2]
+    left, top = max(int(x0) - 2, 0), max(int(y0) - 2, 0)
+    right, bottom = min(int(x1) + 3, w), min(int(y1) + 3, h)
+    if left >= right or top >= bottom:
+        return None
+    return canvas[top:bottom, left:right], left, top
+
+
+def draw_spiral_cv2(canvas: np.ndarray) -> None:
+    """OpenCV counterpart of :func:`draw_spiral` working on an RGB array.
+
+    OpenCV has no alpha fills, so each primitive is drawn on a copy of its
+    bounding region and blended back to keep the translucent overlaps. The
+    anti-aliased edges and blend rounding differ from Pillow's, so this path
+    is a faster look-alike, not a pixel match.
+    """
+
+    height, width = canvas.shape[:2]
+    orbs, rays = spiral_geometry(width, height)
+
+    for x, y, size, k in orbs:
+        region = _region(canvas, x - size, y - size, x + size, y + size)
+        if region is None:
+            continue
+        roi, ox, oy = region
+        layer = roi.copy()
+        cv2.circle(layer, (round(x) - ox, round(y) - oy), size, PALETTE_RGB[k], -1, cv2.LINE_AA)
+        roi[:] = cv2.addWeighted(layer, 180 / 255, roi, 75 / 255, 0)
+
+    for x0, y0, x1, y1, k in rays:
+        region = _region(canvas, min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        if region is None:
+            continue
+        roi, ox, oy = region
+        layer = roi.copy()
+        cv2.line(layer, (round(x0) - ox, round(y0) - oy), (round(x1) - ox, round(y1) - oy),
+                 PALETTE_RGB[k], 3, cv2.LINE_AA)
+        roi[:] = cv2.addWeighted(layer, 100 / 255, roi, 155 / 255, 0)
+
+
+@lru_cache(maxsize=None)
+def label_font() -> ImageFont.ImageFont:
+    """Load the label font once per process."""
+
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=None)
+def text_extent(text: str) -> tuple[int, int]:
+    """Return the cached ``(width, height)`` of ``text`` in the label font."""
+
+    left, top, right, bottom = label_font().getbbox(text)
+    return right - left, bottom - top
+
+
+CHARACTERS = [
+    "Rebecca Respawn",
+    "Virelai",
+    "Ezra Lux",
+    "Athena (Sophia7)",
+    "Thoth (Gnosis7)",
+]
+
+# Unit directions of the name ring, fixed at import
+CHARACTER_DIRECTIONS = [
+    (math.cos(a), math.sin(a))
+    for a in (idx / len(CHARACTERS) * 2 * math.pi for idx in range(len(CHARACTERS)))
+]
 
 
 def label_characters(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
     """Place character names around the spiral."""
 
-    characters = [
-        "Rebecca Respawn",
-        "Virelai",
-        "Ezra Lux",
-        "Athena (Sophia7)",
-        "Thoth (Gnosis7)",
-    ]
-
-    font = ImageFont.load_default()
+    font = label_font()
     cx, cy = width / 2, height / 2
     r = min(cx, cy) * 0.75
 
-    for idx, name in enumerate(characters):
-        angle = (idx / len(characters)) * 2 * math.pi
-        x = cx + r * math.cos(angle)
-        y = cy + r * math.sin(angle)
-        bbox = draw.textbbox((0, 0), name, font=font)
-        w = bbox[2] - bbox[0]
-        h = bbox[3] - bbox[1]
+    for name, (dx, dy) in zip(CHARACTERS, CHARACTER_DIRECTIONS):
+        x = cx + r * dx
+        y = cy + r * dy
+        w, h = text_extent(name)
         draw.text((x - w / 2, y - h / 2), name, fill="white", font=font)
 
 
-def generate_art(width: int, height: int) -> Image.Image:
-    """Render the visionary artwork and return the image object."""
-
-    image = Image.new("RGBA", (width, height), "black")
-    draw = ImageDraw.Draw(image, "RGBA")
+def generate_art(width: int, height: int, tiles: int = 1,
+                 opencv: bool = False) -> Image.Image:
+    """Render the visionary artwork and return the image object.
+
+    ``tiles > 1`` splits the spiral into a ``tiles`` x ``tiles`` grid drawn
+    in worker processes, which pays off on poster-size canvases.
+    ``opencv=True`` rasterizes the spiral with :func:`draw_spiral_cv2`
+    instead; its pixels differ slightly from the Pillow render.
+    """
+
+    if tiles > 1:
+        image = Image.new("RGB", (width, height), "black")
+        xs = np.linspace(0, width, tiles + 1).astype(int).tolist()
+        ys = np.linspace(0, height, tiles + 1).astype(int).tolist()
+        specs = [
+            (width, height, x0, y0, x1 - x0, y1 - y0)
+            for y0, y1 in zip(ys[:-1], ys[1:])
+            for x0, x1 in zip(xs[:-1], xs[1:])
+        ]
+        with ProcessPoolExecutor() as pool:
+            for spec, data in zip(specs, pool.map(render_spiral_tile, specs)):
+                size = (spec[4], spec[5])
+                image.paste(Image.frombytes("RGB", size, data), (spec[2], spec[3]))
+        draw = ImageDraw.Draw(image, "RGBA")
+    elif opencv:
+        # OpenCV rasterizes straight into the NumPy canvas; Pillow only
+        # handles the text labels afterwards.
+        canvas = np.zeros((height, width, 3), np.uint8)
+        draw_spiral_cv2(canvas)
+        image = Image.fromarray(canvas, "RGB")
+        draw = ImageDraw.Draw(image, "RGBA")
+    else:
+        # The canvas is opaque, so keep it RGB; the "RGBA" draw mode still
+        # blends the translucent spiral fills onto it.
+        image = Image.new("RGB", (width, height), "black")
+        draw = ImageDraw.Draw(image, "RGBA")
+        draw_spiral(draw, width, height)
 
-    draw_spiral(draw, width, height)
     label_characters(draw, width, height)
 
     return image
 
 
+# IGNI style ----------------------------------------------------------------
+# Halo ring colors, one per ring; negative channels clamp to 0 as Pillow did
+_halo_hue = np.radians(60 + np.arange(1, 36)[:, None] * 5 + np.array([0, 120, 240]))
+HALO_COLORS = [
+    tuple(c) for c in np.clip((255 * np.sin(_halo_hue)).astype(int), 0, 255).tolist()
+]
+
+
+def igni_gradient(image: Image.Image) -> None:
+    """Gradient background inspired by Alex Grey."""
+
+    width, height = image.size
+    t = (np.arange(height) / height)[:, None]
+    col = (np.array([40, 30, 120]) + np.array([80, 40, 135]) * t).astype(np.uint8)
+    image.paste(vertical_gradient(width, col))
+
+
+def draw_mandala_halos(draw: ImageDraw.ImageDraw, center: tuple[int, int]) -> None:
+    """Mandala halos to mirror chapels in sacred symmetry."""
+
+    for i, color in enumerate(HALO_COLORS, start=1):
+        radius = i * 14
+        draw.ellipse(
+            [
+                center[0] - radius,
+                center[1] - radius,
+                center[0] + radius,
+                center[1] + radius,
+            ],
+            outline=color,
+            width=2,
+        )
+
+
+def draw_igni_spiral(draw: ImageDraw.ImageDraw, center: tuple[int, int],
+                     arms: int = 2200) -> None:
+    """IGNI: Raku Reiki Dragon path (fiery spiral).
+
+    Consecutive segments whose flame color rounds to the same bytes are
+    drawn as one polyline, giving a few hundred calls instead of one per
+    segment with identical pixels.
+    """
+
+    i = np.arange(arms)
+    angle = i * 0.05
+    radius = 2 + i * 0.5
+    points = np.column_stack(
+        [center[0] + radius * np.cos(angle), center[1] + radius * np.sin(angle)]
+    )
+
+    intensity = i[:-1] / arms
+    flame = np.column_stack(
+        [255 * (1 - intensity / 2), 80 + 100 * intensity, 20 + 60 * intensity]
+    ).astype(int)
+    cuts = (np.flatnonzero(np.any(np.diff(flame, axis=0), axis=1)) + 1).tolist()
+    starts, stops = [0] + cuts, cuts + [arms - 1]
+    for start, stop, color in zip(starts, stops, flame[starts].tolist()):
+        # Runs share their end point so the path stays continuous
+        draw.line(points[start:stop + 1].tolist(), fill=tuple(color), width=3)
+
+
+def draw_star_sparks(image: Image.Image, count: int = 300) -> None:
+    """Star sparks for mystical lineage, written straight into the pixels."""
+
+    width, height = image.size
+    rng = np.random.default_rng()
+    arr = np.array(image)
+    ys = rng.integers(0, height, count)
+    xs = rng.integers(0, width, count)
+    arr[ys, xs, :2] = 255
+    arr[ys, xs, 2] = rng.integers(180, 256, count)
+    image.paste(Image.fromarray(arr, "RGB"))
+
+
+def generate_igni(width: int, height: int) -> Image.Image:
+    """Render the IGNI dragon mandala and return the image object."""
+
+    img = Image.new("RGB", (width, height))
+    draw = ImageDraw.Draw(img)
+    center = (width // 2, height // 2)
+
+    igni_gradient(img)
+    draw_mandala_halos(draw, center)
+    draw_igni_spiral(draw, center)
+    draw_star_sparks(img)
+
+    return img
+
+
+# Style registry: renderer and default canvas size
+STYLES: Dict[str, tuple[Callable[..., Image.Image], int]] = {
+    "spiral": (generate_art, 2048),
+    "igni": (generate_igni, 1024),
+}
+
+
+def render(style: str = "spiral", width: int | None = None, height: int | None = None,
+           **options) -> Image.Image:
+    """Render ``style`` at the given size (defaults to the style's own size).
+
+    Extra keyword ``options`` are passed through to the style's renderer.
+    """
+
+    renderer, size = STYLES[style]
+    return renderer(width or size, height or size, **options)
+
+
+# Runtime checks -----------------------------------------------------------
+def pillow_simd() -> bool:
+    """Return True when running on a Pillow-SIMD build ("9.5.0.post1" style)."""
+
+    return ".post" in PIL.__version__
+
+
+@lru_cache(maxsize=None)
+def cpu_has_avx2() -> bool:
+    """Best-effort AVX2 detection from ``/proc/cpuinfo`` (False elsewhere)."""
+
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as fh:
+            return any(line.startswith("flags") and " avx2" in line for line in fh)
+    except OSError:
+        return False
+
+
 # CLI ----------------------------------------------------------------------
 def main() -> None:
     """Parse command-line arguments and generate the artwork."""
@@ -108,105 +398,47 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Render a visionary spiral artwork depicting living gods."
     )
-    parser.add_argument("--width", type=int, default=2048, help="image width")
-    parser.add_argument("--height", type=int, default=2048, help="image height")
+    parser.add_argument("--style", choices=sorted(STYLES), default="spiral", help="artwork style")
+    parser.add_argument("--width", type=int, default=None, help="image width")
+    parser.add_argument("--height", type=int, default=None, help="image height")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="quick preview encode (zlib level 1, slightly larger PNG); overrides PNG_LEVEL",
+    )
+    parser.add_argument(
+        "--opencv",
+        action="store_true",
+        help="rasterize the spiral style with OpenCV (faster; anti-aliased, "
+        "so pixels differ from the default Pillow render)",
+    )
+    parser.add_argument(
+        "--tiles",
+        type=int,
+        default=1,
+        help="render the spiral style as an N x N grid of tiles in parallel processes",
+    )
     args = parser.parse_args()
-
-    art = generate_art(args.width, args.height)
+    if args.tiles > 1 and args.style != "spiral":
+        parser.error("--tiles only applies to the spiral style")
+    if args.opencv:
+        if args.style != "spiral" or args.tiles > 1:
+            parser.error("--opencv only applies to the untiled spiral style")
+        if cv2 is None:
+            parser.error("--opencv needs opencv-python-headless installed")
+
+    print(f"Using Pillow {PIL.__version__}" + (" (SIMD build)" if pillow_simd() else ""))
+    if not pillow_simd() and cpu_has_avx2():
+        print("Tip: this CPU supports AVX2; installing pillow-simd speeds up rendering.")
+    options = {"tiles": args.tiles} if args.tiles > 1 else {}
+    if args.opencv:
+        options["opencv"] = True
+    art = render(args.style, args.width, args.height, **options)
 
     output = Path("Visionary_Dream.png")
-    art.save(output)
+    art.save(output, compress_level=1 if args.fast else png_level())
     print(f"Art saved to {output.resolve()}")
 
 
 if __name__ == "__main__":
     main()
-
-import random
-
-# Third-party import
-from PIL import Image, ImageDraw
-
-# --------------------------------------
-# Parse command-line arguments
-# --------------------------------------
-parser = argparse.ArgumentParser(description="Create visionary art with Pillow")
-parser.add_argument("--width", type=int, default=1024, help="Image width")
-parser.add_argument("--height", type=int, default=1024, help="Image height")
-args = parser.parse_args()
-
-WIDTH, HEIGHT = args.width, args.height
-
-# --------------------------------------
-# Canvas setup
-# --------------------------------------
-img = Image.new("RGB", (WIDTH, HEIGHT))
-draw = ImageDraw.Draw(img)
-
-# --------------------------------------
-# Gradient background inspired by Alex Grey
-# --------------------------------------
-for y in range(HEIGHT):
-    t = y / HEIGHT
-    r = int(40 + 80 * t)
-    g = int(30 + 40 * t)
-    b = int(120 + 135 * t)
-    draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
-
-center = (WIDTH // 2, HEIGHT // 2)
-
-# --------------------------------------
-# Mandala halos to mirror chapels in sacred symmetry
-# --------------------------------------
-for i in range(1, 36):
-    radius = i * 14
-    hue = 60 + i * 5
-    color = (
-        int(255 * math.sin(math.radians(hue))),
-        int(255 * math.sin(math.radians(hue + 120))),
-        int(255 * math.sin(math.radians(hue + 240))),
-    )
-    draw.ellipse(
-        [
-            center[0] - radius,
-            center[1] - radius,
-            center[0] + radius,
-            center[1] + radius,
-        ],
-        outline=color,
-        width=2,
-    )
-
-# --------------------------------------
-# IGNI: Raku Reiki Dragon path (fiery spiral)
-# --------------------------------------
-points = []
-arms = 2200
-for i in range(arms):
-    angle = i * 0.05
-    radius = 2 + i * 0.5
-    x = center[0] + radius * math.cos(angle)
-    y = center[1] + radius * math.sin(angle)
-    points.append((x, y))
-
-for p in range(len(points) - 1):
-    intensity = p / len(points)
-    flame = (
-        int(255 * (1 - intensity / 2)),
-        int(80 + 100 * intensity),
-        int(20 + 60 * intensity),
-    )
-    draw.line([points[p], points[p + 1]], fill=flame, width=3)
-
-# --------------------------------------
-# Star sparks for mystical lineage
-# --------------------------------------
-for _ in range(300):
-    sx = random.randint(0, WIDTH - 1)
-    sy = random.randint(0, HEIGHT - 1)
-    draw.point((sx, sy), fill=(255, 255, random.randint(180, 255)))
-
-# --------------------------------------
-# Save completed visionary piece
-# --------------------------------------
-img.save("Visionary_Dream.png")
@@ -1,6 +1,6 @@
 """Visionary Egregore Network.
 
-Generates a museum-quality network of 144 cultural nodes using Python and matplotlib.
+Generates a museum-quality network of 144 cultural nodes using Python and Pillow.
 The palette draws from Alex Grey's luminous visionary spectrum and saves the result
 to "Visionary_Dream.png" at 2048x2048 resolution.
 """
@@ -9,14 +9,24 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List
 
-import matplotlib.pyplot as plt
 import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from png_options import png_level
 
 # Canvas resolution
 WIDTH, HEIGHT = 2048, 2048
 
+# Stroke and marker sizes in pixels
+EDGE_ALPHA = 128
+NODE_RADIUS = 7
+LABEL_SIZE = 14
+EYE_WIDTH = 7
+CENTER_RADIUS = 20
+
 # Luminous palette inspired by Alex Grey
 PALETTE = [
     "#00FFFF",  # Cyan aura
@@ -123,39 +133,73 @@ def build_nodes(assignments: List[str]) -> List[Node]:
     return nodes
 
 
-def draw_network(nodes: List[Node], steps: List[int], filename: str) -> None:
-    """Render the network of active nodes and save to an image file."""
+def node_arrays(nodes: List[Node]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return node x and y coordinates and active flags as parallel arrays."""
+
+    angles = np.array([node.angle for node in nodes])
+    radii = np.array([node.radius for node in nodes])
+    active = np.array([node.active for node in nodes], dtype=bool)
+    return radii * np.cos(angles), radii * np.sin(angles), active
+
+
+@lru_cache(maxsize=1)
+def label_font() -> ImageFont.ImageFont:
+    """Load the node label font once, falling back to Pillow's default."""
+
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", LABEL_SIZE)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def to_pixels(xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Map unit-circle coordinates to canvas pixels, y pointing up."""
 
-    fig, ax = plt.subplots(figsize=(WIDTH / 256, HEIGHT / 256), dpi=256)
-    ax.set_facecolor("black")
-    plt.axis("off")
+    return (xs * 0.45 + 0.5) * WIDTH, (0.5 - ys * 0.45) * HEIGHT
 
+
+def render(nodes: List[Node], steps: List[int]) -> Image.Image:
+    """Draw the edges, eye and labelled nodes of the active network."""
+
+    img = Image.new("RGB", (WIDTH, HEIGHT), "black")
+    draw = ImageDraw.Draw(img, "RGBA")
+
+    xs, ys, active = node_arrays(nodes)
+    px, py = to_pixels(xs, ys)
+    points = list(zip(px.tolist(), py.tolist()))
+    order = np.arange(len(nodes))
+
+    # Translucent edges, one palette color per step
     for s_idx, step in enumerate(steps):
-        color = PALETTE[s_idx % len(PALETTE)]
-        for i, node in enumerate(nodes):
-            if not node.active:
-                continue
-            j = (i + step) % len(nodes)
-            target = nodes[j]
-            if not target.active:
-                continue
-            xi, yi = node.position
-            xj, yj = target.position
-            ax.plot([xi, xj], [yi, yj], color=color, linewidth=0.3, alpha=0.5)
-
-    for idx, node in enumerate(nodes):
-        if not node.active:
-            continue
-        nx, ny = node.position
-        ax.scatter([nx], [ny], color="white", s=15, zorder=3)
-        ax.text(nx, ny, str(idx + 1), color="white", fontsize=4, ha="center", va="center")
-
-    theta = np.linspace(0, 2 * np.pi, 300)
-    ax.plot(0.25 * np.cos(theta), 0.5 * np.sin(theta), color="white", linewidth=2)
-    ax.scatter([0], [0], color="#FFD700", s=120)
-
-    plt.savefig(filename, facecolor="black", bbox_inches="tight", pad_inches=0)
-    plt.close()
+        fill = ImageColor.getrgb(PALETTE[s_idx % len(PALETTE)]) + (EDGE_ALPHA,)
+        target = (order + step) % len(nodes)
+        live = np.flatnonzero(active & active[target])
+        for i, j in zip(live.tolist(), target[live].tolist()):
+            draw.line([points[i], points[j]], fill=fill, width=1)
+
+    # Guiding eye and its golden center
+    cx, cy = WIDTH / 2, HEIGHT / 2
+    rx, ry = 0.25 * 0.45 * WIDTH, 0.5 * 0.45 * HEIGHT
+    draw.ellipse([cx - rx, cy - ry, cx + rx, cy + ry], outline="white", width=EYE_WIDTH)
+    draw.ellipse(
+        [cx - CENTER_RADIUS, cy - CENTER_RADIUS, cx + CENTER_RADIUS, cy + CENTER_RADIUS],
+        fill="#FFD700",
+    )
+
+    # Active nodes with their index labels on top
+    font = label_font()
+    for idx in np.flatnonzero(active).tolist():
+        x, y = points[idx]
+        draw.ellipse([x - NODE_RADIUS, y - NODE_RADIUS, x + NODE_RADIUS, y + NODE_RADIUS],
+                     fill="white")
+        draw.text((x, y), str(idx + 1), fill="white", font=font, anchor="mm")
+    return img
+
+
+def draw_network(nodes: List[Node], steps: List[int], filename: str) -> None:
+    """Render the network of active nodes and save to an image file."""
+
+    render(nodes, steps).save(filename, compress_level=png_level())
 
 
 def auto_mode(nodes: List[Node], steps: List[int], frames: int = 5) -> None:
@@ -164,7 +208,9 @@ def auto_mode(nodes: List[Node], steps: List[int], frames: int = 5) -> None:
     for frame in range(frames):
         for node in nodes:
             node.active = random.random() > 0.5
-        draw_network(nodes, steps, f"Visionary_Dream_{frame:02d}.png")
+        render(nodes, steps).save(
+            f"Visionary_Dream_{frame:02d}.png", compress_level=png_level()
+        )
 
 
 if __name__ == "__main__":
@@ -16,6 +16,8 @@ from pathlib import Path
 import numpy as np
 from PIL import Image
 
+from png_options import png_level
+
 
 # Ethereal color palette ----------------------------------------------------
 # Palette draws from white light oracle tones and visionary art masters
@@ -43,12 +45,12 @@ def radial_palette(r: np.ndarray) -> np.ndarray:
 def generate_art(width: int, height: int) -> Image.Image:
     """Compose the visionary artwork and return the image."""
 
-    # Coordinate grid normalized to [-1, 1]
-    x = np.linspace(-1, 1, width)
-    y = np.linspace(-1, 1, height)
-    X, Y = np.meshgrid(x, y)
-    r = np.sqrt(X**2 + Y**2)
-    theta = np.arctan2(Y, X)
+    # Coordinate axes normalized to [-1, 1]; a row and a column broadcast
+    # into the (H, W) fields without materializing meshgrid copies
+    x = np.linspace(-1, 1, width, dtype=np.float32)[None, :]
+    y = np.linspace(-1, 1, height, dtype=np.float32)[:, None]
+    r = np.sqrt(x * x + y * y)
+    theta = np.arctan2(y, x)
 
     # Fractal harmonic wave -------------------------------------------------
     wave = np.sin(6 * theta + np.cos(12 * r)) + np.cos(4 * theta)
@@ -82,7 +84,7 @@ def main() -> None:
     args = parser.parse_args()
 
     art = generate_art(args.width, args.height)
-    art.save(args.output)
+    art.save(args.output, compress_level=png_level())
     print(f"Artwork saved to {args.output.resolve()}")
 
 
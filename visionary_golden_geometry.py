@@ -8,9 +8,12 @@ inspiration from Andrew Gonzalez and Emma Kunz.
 import argparse
 import math
 from pathlib import Path
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageColor
 
 from enochian_layers import draw_enochian_grid, draw_celestial_sigils
+from png_options import png_level
 
 # Color palette inspired by visionary artists
 PALETTE = {
@@ -23,44 +26,58 @@ PALETTE = {
     "aether": "#9370db",  # spirit glyph
 }
 
+# Parsed once so draw calls take integer tuples instead of hex strings
+PALETTE_RGB = {name: ImageColor.getrgb(value) for name, value in PALETTE.items()}
+
 PHI = (1 + math.sqrt(5)) / 2  # golden ratio
 
 
 # ---------------------------------------------------------------------------
 # Gradient background
 # ---------------------------------------------------------------------------
-def radial_gradient(img: Image.Image, inner: str, outer: str) -> None:
-    """Fill the image with a radial gradient."""
+def radial_gradient(img: Image.Image, inner: str, outer: str, steps: int = 1024) -> None:
+    """Fill the image with a radial gradient.
+
+    Colors come from a ``steps``-entry lookup table indexed by the scaled
+    distance field, so the per-pixel work is one hypot and one gather.
+    """
     width, height = img.size
     cx, cy = width / 2, height / 2
-    max_radius = math.hypot(cx, cy)
-    inner_rgb = ImageColor.getrgb(inner)
-    outer_rgb = ImageColor.getrgb(outer)
-    draw = ImageDraw.Draw(img)
-    for r in range(int(max_radius), 0, -1):
-        t = r / max_radius
-        color = tuple(
-            int(inner_rgb[i] * t + outer_rgb[i] * (1 - t)) for i in range(3)
-        )
-        bbox = [cx - r, cy - r, cx + r, cy + r]
-        draw.ellipse(bbox, fill=color)
+    scale = np.float32((steps - 1) / math.hypot(cx, cy))
+    t = np.linspace(0.0, 1.0, steps, dtype=np.float32)[:, None]
+    inner_rgb = np.array(ImageColor.getrgb(inner), dtype=np.float32)
+    outer_rgb = np.array(ImageColor.getrgb(outer), dtype=np.float32)
+    lut = (inner_rgb * t + outer_rgb * (1 - t)).astype(np.uint8)
+    dx = (np.arange(width, dtype=np.float32) - np.float32(cx)) * scale
+    dy = (np.arange(height, dtype=np.float32) - np.float32(cy))[:, None] * scale
+    idx = np.hypot(dx, dy).astype(np.intp)
+    np.minimum(idx, steps - 1, out=idx)
+    img.paste(Image.fromarray(lut[idx], "RGB"))
 
 
 # ---------------------------------------------------------------------------
 # Golden spiral rendering
 # ---------------------------------------------------------------------------
-def draw_golden_spiral(draw: ImageDraw.ImageDraw, center: tuple[int, int], color: str) -> None:
-    """Render a golden spiral seeded at the canvas center."""
-    theta = 0.0
-    radius = 2.0
+def draw_golden_spiral(
+    draw: ImageDraw.ImageDraw, center: tuple[int, int], color: tuple[int, int, int]
+) -> None:
+    """Render a golden spiral seeded at the canvas center.
+
+    The dots are spaced further apart as the spiral widens, so each one is
+    still its own ellipse; only the point sequence is computed in NumPy.
+    """
     max_dim = max(draw.im.size)
-    color_rgba = ImageColor.getrgb(color) + (255,)
-    while radius < max_dim:
-        x = center[0] + radius * math.cos(theta)
-        y = center[1] + radius * math.sin(theta)
+    growth = PHI ** (0.05 / (2 * math.pi))
+    n = math.ceil(math.log(max_dim / 2.0) / math.log(growth)) + 2
+    # cumprod/cumsum accumulate in order, matching repeated *= and += exactly
+    radius = np.cumprod(np.r_[2.0, np.full(n - 1, growth)])
+    theta = np.cumsum(np.r_[0.0, np.full(n - 1, 0.05)])
+    keep = radius < max_dim
+    xs = (center[0] + radius[keep] * np.cos(theta[keep])).tolist()
+    ys = (center[1] + radius[keep] * np.sin(theta[keep])).tolist()
+    color_rgba = color + (255,)
+    for x, y in zip(xs, ys):
         draw.ellipse((x - 2, y - 2, x + 2, y + 2), fill=color_rgba)
-        theta += 0.05
-        radius *= PHI ** (0.05 / (2 * math.pi))
 
 
 # ---------------------------------------------------------------------------
@@ -75,7 +92,7 @@ def draw_elemental_glyphs(draw: ImageDraw.ImageDraw, center: tuple[int, int], si
         (center[0] - half, center[1] - half),
         (center[0] + half, center[1] - half),
     ]
-    draw.polygon(fire, outline=PALETTE["fire"], width=3)
+    draw.polygon(fire, outline=PALETTE_RGB["fire"], width=3)
 
     # Water – downward triangle
     water = [
@@ -83,7 +100,7 @@ def draw_elemental_glyphs(draw: ImageDraw.ImageDraw, center: tuple[int, int], si
         (center[0] - half, center[1] + half),
         (center[0] + half, center[1] + half),
     ]
-    draw.polygon(water, outline=PALETTE["water"], width=3)
+    draw.polygon(water, outline=PALETTE_RGB["water"], width=3)
 
     # Air – upward triangle with a horizontal line
     air = [
@@ -91,10 +108,10 @@ def draw_elemental_glyphs(draw: ImageDraw.ImageDraw, center: tuple[int, int], si
         (center[0] + half, center[1] + half),
         (center[0] + half, center[1] - half),
     ]
-    draw.polygon(air, outline=PALETTE["air"], width=3)
+    draw.polygon(air, outline=PALETTE_RGB["air"], width=3)
     draw.line(
         [(center[0] + half, center[1]), (center[0] + size, center[1])],
-        fill=PALETTE["air"],
+        fill=PALETTE_RGB["air"],
         width=3,
     )
 
@@ -105,13 +122,13 @@ def draw_elemental_glyphs(draw: ImageDraw.ImageDraw, center: tuple[int, int], si
         (earth_center[0] - half, earth_center[1] + half),
         (earth_center[0] + half, earth_center[1] + half),
     ]
-    draw.polygon(earth, outline=PALETTE["earth"], width=3)
+    draw.polygon(earth, outline=PALETTE_RGB["earth"], width=3)
     draw.line(
         [
             (earth_center[0] - half, earth_center[1] + half),
             (earth_center[0] + half, earth_center[1] + half),
         ],
-        fill=PALETTE["earth"],
+        fill=PALETTE_RGB["earth"],
         width=3,
     )
 
@@ -120,11 +137,11 @@ def draw_elemental_glyphs(draw: ImageDraw.ImageDraw, center: tuple[int, int], si
     top = center[1] - half
     right = center[0] - half
     bottom = center[1] + half
-    draw.rectangle([left, top, right, bottom], outline=PALETTE["earth"], width=3)
-    draw.line([(left, center[1]), (right, center[1])], fill=PALETTE["earth"], width=3)
+    draw.rectangle([left, top, right, bottom], outline=PALETTE_RGB["earth"], width=3)
+    draw.line([(left, center[1]), (right, center[1])], fill=PALETTE_RGB["earth"], width=3)
     draw.line(
         [(center[0] - 0.75 * size, top), (center[0] - 0.75 * size, bottom)],
-        fill=PALETTE["earth"],
+        fill=PALETTE_RGB["earth"],
         width=3,
     )
 
@@ -132,7 +149,7 @@ def draw_elemental_glyphs(draw: ImageDraw.ImageDraw, center: tuple[int, int], si
     r = half
     draw.ellipse(
         [center[0] - r, center[1] - r, center[0] + r, center[1] + r],
-        outline=PALETTE["aether"],
+        outline=PALETTE_RGB["aether"],
         width=3,
     )
 
@@ -155,7 +172,7 @@ def main() -> None:
     draw = ImageDraw.Draw(img, "RGBA")
     center = (args.width // 2, args.height // 2)
 
-    draw_golden_spiral(draw, center, PALETTE["spiral"])
+    draw_golden_spiral(draw, center, PALETTE_RGB["spiral"])
     glyph_size = int(min(args.width, args.height) / (PHI * 3))
     draw_elemental_glyphs(draw, center, glyph_size)
 
@@ -163,7 +180,7 @@ def main() -> None:
     draw_enochian_grid(draw, args.width, args.height)
     draw_celestial_sigils(draw, args.width, args.height)
 
-    img.save(args.output)
+    img.save(args.output, compress_level=png_level())
     print(f"Artwork saved to {Path(args.output).resolve()}")
 
 
@@ -1,11 +1,14 @@
 """Visionary Hilma Template: generate museum-quality art."""
 
 # — Imports and alchemical setup —
-import math
 import random
 from pathlib import Path
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+from mandala import gradient_rows, vertical_gradient
+from png_options import png_level
 
 # — Canvas dimensions (1920x1080) —
 WIDTH, HEIGHT = 1920, 1080
@@ -19,31 +22,37 @@ PALETTE = [
     "#F6B4D8",  # Rose
     "#D8F6B4",  # Light Green
 ]
+ORB_COLORS = [ImageColor.getrgb(c) for c in PALETTE[1:]]
+
+
+def generate_art() -> Image.Image:
+    """Paint the pastel gradient, orb spiral and veils; return the image."""
 
-# — Birth the canvas and pastel gradient —
-image = Image.new("RGB", (WIDTH, HEIGHT), PALETTE[0])
-draw = ImageDraw.Draw(image)
-for y in range(HEIGHT):
-    t = y / HEIGHT
-    r = int(246 * (1 - t) + 180 * t)
-    g = int(227 * (1 - t) + 200 * t)
-    b = int(180 * (1 - t) + 246 * t)
-    draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
-
-# — Spiral the lattice with pastel orbs —
-max_radius = min(CENTER)
-for step in range(720):
-    angle = math.radians(step)
+    # — Birth the canvas and pastel gradient —
+    image = vertical_gradient(WIDTH, gradient_rows(HEIGHT, (246, 227, 180), (180, 200, 246)))
+    draw = ImageDraw.Draw(image)
+
+    # — Spiral the lattice with pastel orbs —
+    max_radius = min(CENTER)
+    rings = range(60, max_radius, 80)
+    spiral_colors = random.choices(ORB_COLORS, k=720)
+    ring_colors = random.choices(ORB_COLORS, k=len(rings))
+    step = np.arange(720)
+    angle = np.radians(step) * 4
     radius = (step / 720) * max_radius
-    x = CENTER[0] + radius * math.cos(angle * 4)
-    y = CENTER[1] + radius * math.sin(angle * 4)
-    color = random.choice(PALETTE[1:])
-    draw.ellipse([x - 3, y - 3, x + 3, y + 3], fill=color)
+    xs = (CENTER[0] + radius * np.cos(angle)).tolist()
+    ys = (CENTER[1] + radius * np.sin(angle)).tolist()
+    for x, y, color in zip(xs, ys, spiral_colors):
+        draw.ellipse([x - 3, y - 3, x + 3, y + 3], fill=color)
+
+    # — Encircle with concentric veils —
+    for r, color in zip(rings, ring_colors):
+        bbox = [CENTER[0] - r, CENTER[1] - r, CENTER[0] + r, CENTER[1] + r]
+        draw.ellipse(bbox, outline=color, width=4)
+
+    return image
 
-# — Encircle with concentric veils —
-for r in range(60, max_radius, 80):
-    bbox = [CENTER[0] - r, CENTER[1] - r, CENTER[0] + r, CENTER[1] + r]
-    draw.ellipse(bbox, outline=random.choice(PALETTE[1:]), width=4)
 
 # — Save the visionary dream —
-image.save(Path("Visionary_Dream.png"))
+if __name__ == "__main__":
+    generate_art().save(Path("Visionary_Dream.png"), compress_level=png_level())
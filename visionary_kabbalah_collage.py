@@ -12,10 +12,14 @@ from __future__ import annotations
 # Imports and setup ---------------------------------------------------------
 import math
 from pathlib import Path
-from typing import List, Tuple
+from typing import List
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageColor
 
+from mandala import vertical_gradient
+from png_options import png_level
+
 # Color palette inspired by Alex Grey ---------------------------------------
 PALETTE: List[str] = [
     "#260046",  # Deep Cosmic Violet
@@ -28,53 +32,44 @@ PALETTE: List[str] = [
 
 WIDTH, HEIGHT = 1920, 1080
 
-
-def linear_gradient(start: str, end: str, t: float) -> Tuple[int, int, int]:
-    """Interpolate between two hex colors."""
-
-    r1, g1, b1 = ImageColor.getrgb(start)
-    r2, g2, b2 = ImageColor.getrgb(end)
-    r = int(r1 + (r2 - r1) * t)
-    g = int(g1 + (g2 - g1) * t)
-    b = int(b1 + (b2 - b1) * t)
-    return r, g, b
-
-
-def paint_gradient(draw: ImageDraw.ImageDraw) -> None:
+# Sefirot positions as fractions of the canvas ------------------------------
+SEFIROT = np.array([
+    (0.5, 0.05),  # Keter
+    (0.35, 0.15), (0.65, 0.15),  # Chokhmah, Binah
+    (0.2, 0.35), (0.5, 0.30), (0.8, 0.35),  # Chesed, Tiferet, Gevurah
+    (0.2, 0.55), (0.5, 0.60), (0.8, 0.55),  # Netzach, Yesod, Hod
+    (0.5, 0.85),  # Malkuth
+])
+
+# Index pairs of sefirot joined by a path
+TREE_PATHS = np.array([
+    (0, 1), (0, 2), (1, 4), (2, 4),
+    (1, 3), (2, 5), (3, 4), (4, 5),
+    (3, 6), (4, 7), (5, 8),
+    (6, 7), (7, 8), (6, 9), (8, 9),
+], dtype=np.int32)
+
+
+def paint_gradient(image: Image.Image) -> None:
     """Fill background with vertical gradient across the palette."""
 
     segments = len(PALETTE) - 1
-    for y in range(HEIGHT):
-        pos = y / (HEIGHT - 1)
-        idx = min(int(pos * segments), segments - 1)
-        t = pos * segments - idx
-        color = linear_gradient(PALETTE[idx], PALETTE[idx + 1], t)
-        draw.line([(0, y), (WIDTH, y)], fill=color)
+    stops = np.array([ImageColor.getrgb(c) for c in PALETTE], dtype=np.float64)
+    pos = np.arange(HEIGHT) / (HEIGHT - 1) * segments
+    idx = np.minimum(pos.astype(np.int32), segments - 1)
+    t = (pos - idx)[:, None]
+    col = (stops[idx] + (stops[idx + 1] - stops[idx]) * t).astype(np.uint8)
+    image.paste(vertical_gradient(WIDTH, col))
 
 
 def draw_tree_of_life(draw: ImageDraw.ImageDraw) -> None:
     """Render the ten sefirot and the twenty-two connecting paths."""
 
-    # Predefined positions for sefirot as relative coordinates
-    positions = [
-        (0.5, 0.05),  # Keter
-        (0.35, 0.15), (0.65, 0.15),  # Chokhmah, Binah
-        (0.2, 0.35), (0.5, 0.30), (0.8, 0.35),  # Chesed, Tiferet, Gevurah
-        (0.2, 0.55), (0.5, 0.60), (0.8, 0.55),  # Netzach, Yesod, Hod
-        (0.5, 0.85),  # Malkuth
-    ]
-
     # Convert to pixel coordinates
-    coords = [(int(x * WIDTH), int(y * HEIGHT)) for x, y in positions]
+    coords = [tuple(p) for p in (SEFIROT * (WIDTH, HEIGHT)).astype(np.int32).tolist()]
 
     # Draw connecting paths
-    path_pairs = [
-        (0, 1), (0, 2), (1, 4), (2, 4),
-        (1, 3), (2, 5), (3, 4), (4, 5),
-        (3, 6), (4, 7), (5, 8),
-        (6, 7), (7, 8), (6, 9), (8, 9),
-    ]
-    for a, b in path_pairs:
+    for a, b in TREE_PATHS.tolist():
         draw.line([coords[a], coords[b]], fill=PALETTE[3], width=4)
 
     # Draw sefirot
@@ -96,8 +91,10 @@ def draw_hermetic_star(draw: ImageDraw.ImageDraw) -> None:
     # Hexagram
     angles = [math.radians(60 * i - 30) for i in range(6)]
     points = [(cx + math.cos(a) * radius * 0.8, cy + math.sin(a) * radius * 0.8) for a in angles]
-    for i in range(6):
-        draw.line([points[i], points[(i + 2) % 6]], fill=PALETTE[1], width=3)
+    # Two interlaced triangles, each traced as one closed polyline
+    for start in (0, 1):
+        tri = points[start::2]
+        draw.line(tri + tri[:1], fill=PALETTE[1], width=3, joint="curve")
 
 
 def generate_art() -> Image.Image:
@@ -107,7 +104,7 @@ def generate_art() -> Image.Image:
     draw = ImageDraw.Draw(image)
 
     # Background gradient
-    paint_gradient(draw)
+    paint_gradient(image)
 
     # Tree of Life centerpiece
     draw_tree_of_life(draw)
@@ -123,7 +120,7 @@ def main() -> None:
 
     output = Path("Visionary_Dream.png")
     art = generate_art()
-    art.save(output)
+    art.save(output, compress_level=png_level())
     print(f"Art saved to {output.resolve()}")
 
 
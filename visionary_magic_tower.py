@@ -3,10 +3,13 @@
 # — Imports and sacred setup —
 from __future__ import annotations
 
-import math
 from pathlib import Path
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+from mandala import gradient_rows, vertical_gradient
+from png_options import png_level
 
 # — Canvas dimensions —
 WIDTH, HEIGHT = 1920, 1080
@@ -22,15 +25,11 @@ PALETTE = [
 ]
 
 
-def vertical_gradient(draw: ImageDraw.ImageDraw) -> None:
+def sky_gradient(image: Image.Image) -> None:
     """Blend the sky for endless ascent."""
 
-    for y in range(HEIGHT):
-        ratio = y / HEIGHT
-        r = int(18 * (1 - ratio) + 255 * ratio)
-        g = int(0 * (1 - ratio) + 183 * ratio)
-        b = int(43 * (1 - ratio) + 255 * ratio)
-        draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
+    rows = gradient_rows(HEIGHT, (18, 0, 43), (255, 183, 255))
+    image.paste(vertical_gradient(WIDTH, rows))
 
 
 def tower_grid(draw: ImageDraw.ImageDraw) -> None:
@@ -57,12 +56,15 @@ def elevator_paths(draw: ImageDraw.ImageDraw) -> None:
     """Weave infinite elevator trajectories."""
 
     max_radius = min(CENTER)
-    for step in range(0, 360, 6):
-        angle = math.radians(step)
-        for radius in range(100, max_radius, 50):
-            x = CENTER[0] + radius * math.cos(angle + radius / 80)
-            y = CENTER[1] + radius * math.sin(angle + radius / 80)
-            color = PALETTE[(step // 6) % len(PALETTE)]
+    # One row of points per trajectory, one column per radius
+    steps = np.arange(0, 360, 6)
+    radii = np.arange(100, max_radius, 50)
+    angle = np.radians(steps)[:, None] + radii / 80
+    xs = (CENTER[0] + radii * np.cos(angle)).tolist()
+    ys = (CENTER[1] + radii * np.sin(angle)).tolist()
+    for k, (row_x, row_y) in enumerate(zip(xs, ys)):
+        color = ImageColor.getrgb(PALETTE[k % len(PALETTE)])
+        for x, y in zip(row_x, row_y):
             draw.ellipse([x - 4, y - 4, x + 4, y + 4], fill=color)
 
 
@@ -72,12 +74,12 @@ def main() -> None:
     image = Image.new("RGB", (WIDTH, HEIGHT), PALETTE[0])
     draw = ImageDraw.Draw(image)
 
-    vertical_gradient(draw)
+    sky_gradient(image)
     tower_grid(draw)
     elevator_paths(draw)
 
     output = Path("Visionary_Dream.png")
-    image.save(output)
+    image.save(output, compress_level=png_level())
     print(f"Art saved to {output.resolve()}")
 
 
@@ -12,13 +12,14 @@ The image is rendered at 2048x2048 resolution and saved as
 from __future__ import annotations
 
 import math
-import random
 from pathlib import Path
 from datetime import datetime
 
-
+import numpy as np
 from PIL import Image, ImageDraw
 
+from png_options import png_level
+
 # Canvas configuration ------------------------------------------------------
 WIDTH, HEIGHT = 2048, 2048
 
@@ -34,17 +35,22 @@ PALETTE = [
 ]
 
 
-def background_gradient(draw: ImageDraw.ImageDraw) -> None:
-    """Create radial gradient background."""
+def background_gradient(image: Image.Image) -> None:
+    """Create radial gradient background.
+
+    Each pixel takes the color of its rounded radius from a per-radius
+    table, the same colors the ring-by-ring fill painted without the overdraw.
+    """
 
     cx, cy = WIDTH / 2, HEIGHT / 2
     max_radius = math.hypot(cx, cy)
-    for r in range(int(max_radius), 0, -1):
-        ratio = r / max_radius
-        red = int(0 * ratio + 7 * (1 - ratio))
-        green = int(43 * ratio + 54 * (1 - ratio))
-        blue = int(54 * ratio + 66 * (1 - ratio))
-        draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=(red, green, blue))
+    ratio = (np.arange(int(max_radius) + 1) / max_radius)[:, None]
+    lut = (np.array([0, 43, 54]) * ratio + np.array([7, 54, 66]) * (1 - ratio)).astype(np.uint8)
+    dx = np.arange(WIDTH) - cx
+    dy = (np.arange(HEIGHT) - cy)[:, None]
+    idx = np.rint(np.hypot(dx, dy)).astype(np.intp)
+    np.clip(idx, 1, len(lut) - 1, out=idx)
+    image.paste(Image.fromarray(lut[idx], "RGB"))
 
 
 def monad_patterns(draw: ImageDraw.ImageDraw) -> None:
@@ -62,22 +68,19 @@ def monad_patterns(draw: ImageDraw.ImageDraw) -> None:
             width=3,
         )
 
-    # Mirrored arcs for nodal connections
-    for i in range(64):
-        angle = math.radians(i * 5)
-        radius = WIDTH / 3 + i * 5
-        x = cx + math.cos(angle) * radius
-        y = cy + math.sin(angle) * radius
-        size = 20 + (i % 7) * 5
-        color = random.choice(PALETTE)
+    # Mirrored arcs for nodal connections; positions and colors in one batch
+    i = np.arange(64)
+    angle = np.radians(i * 5)
+    radius = WIDTH / 3 + i * 5
+    xs = (cx + np.cos(angle) * radius).tolist()
+    ys = (cy + np.sin(angle) * radius).tolist()
+    sizes = (20 + (i % 7) * 5).tolist()
+    color_idx = np.random.default_rng().integers(0, len(PALETTE), 64).tolist()
+    for x, y, size, k in zip(xs, ys, sizes, color_idx):
+        color = PALETTE[k]
+        mx, my = 2 * cx - x, 2 * cy - y
         draw.arc([x - size, y - size, x + size, y + size], 0, 360, fill=color, width=2)
-        draw.arc(
-            [2 * cx - x - size, 2 * cy - y - size, 2 * cx - x + size, 2 * cy - y + size],
-            0,
-            360,
-            fill=color,
-            width=2,
-        )
+        draw.arc([mx - size, my - size, mx + size, my + size], 0, 360, fill=color, width=2)
 
 
 def main() -> None:
@@ -86,13 +89,13 @@ def main() -> None:
     image = Image.new("RGB", (WIDTH, HEIGHT), PALETTE[0])
     draw = ImageDraw.Draw(image)
 
-    background_gradient(draw)
+    background_gradient(image)
     monad_patterns(draw)
 
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output = Path(f"Visionary_Dream_{stamp}.png")
 
-    image.save(output)
+    image.save(output, compress_level=png_level())
     print(f"Art saved to {output.resolve()}")
 
 
@@ -9,12 +9,16 @@ palette. The image is rendered at 2048x2048 resolution and saved as
 from __future__ import annotations
 
 # Imports and setup ---------------------------------------------------------
+from functools import lru_cache
 from pathlib import Path
 import math
 from typing import List, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from png_options import png_level
+
 # Color palette inspired by Alex Grey ---------------------------------------
 PALETTE: List[str] = [
     "#280050",  # Deep Indigo
@@ -44,26 +48,46 @@ PATHS: List[Tuple[str, str]] = [
 WIDTH, HEIGHT = 2048, 2048
 
 
+@lru_cache(maxsize=64)
 def hex_to_rgba(color: str, alpha: int = 255) -> Tuple[int, int, int, int]:
     """Convert hex color to RGBA."""
-    r = int(color[1:3], 16)
-    g = int(color[3:5], 16)
-    b = int(color[5:7], 16)
+    r, g, b = bytes.fromhex(color.lstrip("#"))
     return (r, g, b, alpha)
 
 
+# Palette parsed once at import; the drawing loops index these tuples
+PALETTE_RGBA = [hex_to_rgba(c) for c in PALETTE]
+PALETTE_RGBA180 = [hex_to_rgba(c, 180) for c in PALETTE]
+PALETTE_ARRAY = np.array(PALETTE_RGBA, dtype=np.uint8)
+
+
+@lru_cache(maxsize=1)
+def label_font() -> ImageFont.ImageFont:
+    """Load the path label font once, falling back to Pillow's default."""
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", 36)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def label_size(label: str) -> Tuple[int, int]:
+    """Return the cached ``(width, height)`` of a path label."""
+    left, top, right, bottom = label_font().getbbox(label)
+    return right - left, bottom - top
+
+
 # Gradient background -------------------------------------------------------
-def draw_gradient(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
+def draw_gradient(image: Image.Image) -> None:
     """Render radial gradient using the Alex Grey palette."""
+    width, height = image.size
     cx, cy = width / 2, height / 2
     max_r = math.hypot(cx, cy)
-    for y in range(height):
-        for x in range(width):
-            r = math.hypot(x - cx, y - cy)
-            t = r / max_r
-            idx = int(t * (len(PALETTE) - 1))
-            color = hex_to_rgba(PALETTE[idx])
-            draw.point((x, y), fill=color)
+    dx = np.arange(width) - cx
+    dy = (np.arange(height) - cy)[:, None]
+    idx = (np.hypot(dx, dy) / max_r * (len(PALETTE) - 1)).astype(np.intp)
+    # Every band is opaque, so gathering from the palette replaces the pixels outright
+    image.paste(Image.fromarray(PALETTE_ARRAY[idx], "RGBA"))
 
 
 # Spiral rendering ----------------------------------------------------------
@@ -73,19 +97,16 @@ def draw_spiral(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
     max_radius = min(cx, cy) * 0.9
     turns = 12
     total_steps = turns * 360
-    for i in range(total_steps):
-        angle = math.radians(i)
-        radius = max_radius * i / total_steps
-        x = cx + math.cos(angle) * radius
-        y = cy + math.sin(angle) * radius
-        color = hex_to_rgba(PALETTE[i % len(PALETTE)], 180)
-        draw.ellipse([(x - 6, y - 6), (x + 6, y + 6)], fill=color)
+    i = np.arange(total_steps)
+    angle = np.radians(i)
+    radius = max_radius * i / total_steps
+    xs = (cx + np.cos(angle) * radius).tolist()
+    ys = (cy + np.sin(angle) * radius).tolist()
+    for k, (x, y) in enumerate(zip(xs, ys)):
+        draw.ellipse([(x - 6, y - 6), (x + 6, y + 6)], fill=PALETTE_RGBA180[k % len(PALETTE)])
 
     # Label each path along the spiral
-    try:
-        font = ImageFont.truetype("DejaVuSans.ttf", 36)
-    except OSError:
-        font = ImageFont.load_default()
+    font = label_font()
 
     step_per_label = total_steps // len(PATHS)
     for idx, (num, title) in enumerate(PATHS):
@@ -94,9 +115,7 @@ def draw_spiral(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
         x = cx + math.cos(angle) * radius
         y = cy + math.sin(angle) * radius
         label = f"{num} {title}"
-        bbox = draw.textbbox((0, 0), label, font=font)
-        w = bbox[2] - bbox[0]
-        h = bbox[3] - bbox[1]
+        w, h = label_size(label)
         draw.text((x - w / 2, y - h / 2), label, fill="white", font=font)
 
 
@@ -105,7 +124,7 @@ def generate_art(width: int, height: int) -> Image.Image:
     """Generate the visionary artwork."""
     image = Image.new("RGBA", (width, height))
     draw = ImageDraw.Draw(image, "RGBA")
-    draw_gradient(draw, width, height)
+    draw_gradient(image)
     draw_spiral(draw, width, height)
     return image
 
@@ -114,7 +133,7 @@ def main() -> None:
     """Create and save the visionary artwork."""
     art = generate_art(WIDTH, HEIGHT)
     output = Path("Visionary_Dream.png")
-    art.save(output)
+    art.save(output, compress_level=png_level())
     print(f"Art saved to {output.resolve()}")
 
 
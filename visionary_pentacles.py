@@ -12,12 +12,15 @@ from __future__ import annotations
 
 import argparse
 import math
-import random
 from pathlib import Path
 from typing import List, Tuple
 
+import numpy as np
 from PIL import Image, ImageColor, ImageDraw
 
+from mandala import vertical_gradient
+from png_options import png_level
+
 
 # Color palette inspired by Alex Grey's emerald and golden hues -------------
 PALETTE: List[str] = [
@@ -36,18 +39,20 @@ def hex_to_rgb(color: str) -> Tuple[int, int, int]:
     return ImageColor.getrgb(color)
 
 
+# Palette parsed once at import; the ring and root loops index these tuples
+PALETTE_RGB = tuple(hex_to_rgb(c) for c in PALETTE)
+
+
 # Gradient background -------------------------------------------------------
-def draw_gradient(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
+def draw_gradient(image: Image.Image) -> None:
     """Render a vertical gradient from deep green to luminous gold."""
 
-    top = hex_to_rgb(PALETTE[0])
-    bottom = hex_to_rgb(PALETTE[3])
-    for y in range(height):
-        blend = y / (height - 1)
-        r = int(top[0] + (bottom[0] - top[0]) * blend)
-        g = int(top[1] + (bottom[1] - top[1]) * blend)
-        b = int(top[2] + (bottom[2] - top[2]) * blend)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    width, height = image.size
+    top = np.array(PALETTE_RGB[0])
+    bottom = np.array(PALETTE_RGB[3])
+    blend = (np.arange(height) / (height - 1))[:, None]
+    col = (top + (bottom - top) * blend).astype(np.uint8)
+    image.paste(vertical_gradient(width, col))
 
 
 # Labyrinth geometry --------------------------------------------------------
@@ -57,17 +62,15 @@ def draw_labyrinth(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
     cx, cy = width // 2, height // 2
     radius = min(cx, cy) * 0.9
     rings = 12
-    for i in range(rings):
-        angle_offset = math.radians((i % 2) * 36)
-        r = radius * (1 - i / rings)
-        points = []
-        for j in range(5):
-            angle = angle_offset + j * math.tau / 5
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            points.append((x, y))
-        color = hex_to_rgb(PALETTE[i % len(PALETTE)])
-        draw.polygon(points, outline=color)
+    # One row of five vertices per ring; odd rings turn by 36 degrees
+    i = np.arange(rings)[:, None]
+    angle = np.radians((i % 2) * 36) + np.arange(5) * math.tau / 5
+    r = radius * (1 - i / rings)
+    xs = (cx + r * np.cos(angle)).tolist()
+    ys = (cy + r * np.sin(angle)).tolist()
+    for k, (row_x, row_y) in enumerate(zip(xs, ys)):
+        color = PALETTE_RGB[k % len(PALETTE_RGB)]
+        draw.polygon(list(zip(row_x, row_y)), outline=color)
 
 
 # Root network --------------------------------------------------------------
@@ -75,21 +78,20 @@ def draw_roots(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
     """Grow organic root tendrils radiating from the center."""
 
     cx, cy = width // 2, height // 2
-    branches = 60
-    for i in range(branches):
-        angle = math.tau * i / branches
-        length = random.uniform(height * 0.25, height * 0.45)
-        steps = 100
-        pts = []
-        for s in range(steps):
-            t = s / steps
-            r = length * t + random.uniform(-5, 5)
-            wobble = math.sin(t * math.pi * random.randint(1, 5)) * 15
-            x = cx + math.cos(angle) * r + math.cos(angle + math.pi / 2) * wobble
-            y = cy + math.sin(angle) * r + math.sin(angle + math.pi / 2) * wobble
-            pts.append((x, y))
-        shade = hex_to_rgb(PALETTE[2 if i % 2 == 0 else 1])
-        draw.line(pts, fill=shade, width=2)
+    branches, steps = 60, 100
+    rng = np.random.default_rng()
+    # One row per branch, one column per step along it
+    angle = (math.tau * np.arange(branches) / branches)[:, None]
+    length = rng.uniform(height * 0.25, height * 0.45, size=(branches, 1))
+    t = np.arange(steps) / steps
+    r = length * t + rng.uniform(-5, 5, size=(branches, steps))
+    # Each step draws its own wobble frequency, as the tendrils always have
+    wobble = np.sin(t * math.pi * rng.integers(1, 6, size=(branches, steps))) * 15
+    xs = cx + np.cos(angle) * r + np.cos(angle + math.pi / 2) * wobble
+    ys = cy + np.sin(angle) * r + np.sin(angle + math.pi / 2) * wobble
+    for i, (row_x, row_y) in enumerate(zip(xs.tolist(), ys.tolist())):
+        shade = PALETTE_RGB[2 if i % 2 == 0 else 1]
+        draw.line(list(zip(row_x, row_y)), fill=shade, width=2)
 
 
 # Core rendering ------------------------------------------------------------
@@ -100,7 +102,7 @@ def generate_art(width: int, height: int) -> Image.Image:
     draw = ImageDraw.Draw(image)
 
     # Layer 1: gradient soil and sun
-    draw_gradient(draw, width, height)
+    draw_gradient(image)
 
     # Layer 2: sacred labyrinth geometry
     draw_labyrinth(draw, width, height)
@@ -124,7 +126,7 @@ def main() -> None:
     args = parser.parse_args()
 
     art = generate_art(args.width, args.height)
-    art.save(args.output)
+    art.save(args.output, compress_level=png_level())
     print(f"Art saved to {args.output.resolve()}")
 
 
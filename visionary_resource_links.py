@@ -10,14 +10,27 @@ from __future__ import annotations
 
 # Imports and setup ---------------------------------------------------------
 import argparse
+import functools
 import hashlib
 import json
-import math
+from collections import deque
 from pathlib import Path
-from typing import Iterable, List
+from typing import List
 
+import numpy as np
 from PIL import Image, ImageColor, ImageDraw
 
+from mandala import vertical_gradient
+from png_options import png_level
+
+try:  # optional streaming parser for large quest files
+    import ijson
+except ImportError:  # pragma: no cover - ijson not installed
+    ijson = None
+
+# Files at least this large are streamed with ijson when it is available
+STREAM_THRESHOLD = 64 * 1024
+
 # Color palette inspired by Hilma af Klint ---------------------------------
 PALETTE: List[str] = [
     "#F6C5D0",  # Soft Pink
@@ -28,77 +41,112 @@ PALETTE: List[str] = [
     "#FFFFFF",  # Pure Light
 ]
 
-
-def collect_links(node: object) -> Iterable[str]:
-    """Recursively yield all ``link`` values from a JSON structure."""
-
-    if isinstance(node, dict):
-        for key, value in node.items():
-            if key == "link" and isinstance(value, str):
-                yield value
-            else:
-                yield from collect_links(value)
-    elif isinstance(node, list):
-        for item in node:
-            yield from collect_links(item)
-
-
+# Palette parsed once at import; drawing code indexes these tuples
+PALETTE_RGB: List[tuple[int, int, int]] = [ImageColor.getrgb(c) for c in PALETTE]
+
+
+def collect_links(node: object) -> List[str]:
+    """Return all ``link`` values from a JSON structure in document order.
+
+    An explicit stack replaces generator recursion, so deeply nested rooms
+    cannot hit the recursion limit. Children are pushed in reverse so they
+    pop in their original order; link strings ride the same stack.
+    """
+
+    links: List[str] = []
+    stack = deque([node] if isinstance(node, (dict, list)) else [])
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            links.append(item)
+        elif isinstance(item, dict):
+            for key, value in reversed(item.items()):
+                if isinstance(value, (dict, list)) or (key == "link" and isinstance(value, str)):
+                    stack.append(value)
+        else:
+            stack.extend([value for value in reversed(item) if isinstance(value, (dict, list))])
+    return links
+
+
+def load_links(source: Path) -> List[str]:
+    """Return every ``link`` string in ``source``, streaming large files."""
+
+    with source.open("rb", buffering=65536) as fh:
+        if ijson is None or source.stat().st_size < STREAM_THRESHOLD:
+            return collect_links(json.load(fh))
+        # Same matches as collect_links: a string that is the direct value of
+        # a key named exactly "link" (the event right after that map_key)
+        links: List[str] = []
+        key = None
+        for _, event, value in ijson.parse(fh):
+            if event == "string" and key == "link":
+                links.append(value)
+            key = value if event == "map_key" else None
+        return links
+
+
+@functools.lru_cache(maxsize=None)
 def hash_color(url: str) -> tuple[int, int, int]:
-    """Map a URL to a color from the palette using a hash."""
+    """Map a URL to a color from the palette using a hash.
+
+    Links repeat across rooms, so each distinct URL is hashed only once.
+    """
 
     digest = hashlib.sha256(url.encode()).digest()
     idx = digest[0] % len(PALETTE)
-    return ImageColor.getrgb(PALETTE[idx])
+    return PALETTE_RGB[idx]
 
 
-def paint_gradient(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
+def paint_gradient(image: Image.Image) -> None:
     """Fill the background with a vertical gradient across the palette."""
 
+    width, height = image.size
     segments = len(PALETTE) - 1
-    for y in range(height):
-        pos = y / (height - 1)
-        idx = min(int(pos * segments), segments - 1)
-        t = pos * segments - idx
-        start = ImageColor.getrgb(PALETTE[idx])
-        end = ImageColor.getrgb(PALETTE[idx + 1])
-        r = int(start[0] + (end[0] - start[0]) * t)
-        g = int(start[1] + (end[1] - start[1]) * t)
-        b = int(start[2] + (end[2] - start[2]) * t)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    stops = np.array(PALETTE_RGB, dtype=np.float64)
+    pos = np.arange(height) / (height - 1) * segments
+    idx = np.minimum(pos.astype(np.int32), segments - 1)
+    t = (pos - idx)[:, None]
+    col = (stops[idx] + (stops[idx + 1] - stops[idx]) * t).astype(np.uint8)
+    image.paste(vertical_gradient(width, col))
 
 
-def draw_links(draw: ImageDraw.ImageDraw, links: List[str], width: int, height: int) -> None:
-    """Render each link as an orb along a spiral path."""
+def layout_links(links: List[str], width: int, height: int) -> List[tuple]:
+    """Compute every orb's ``(x, y, size, rgba)`` once, before any drawing."""
 
     cx, cy = width / 2, height / 2
     max_radius = min(cx, cy) * 0.9
     total = max(len(links), 1)
 
-    for i, link in enumerate(links):
-        angle = math.radians(i * 15)
-        radius = max_radius * (i + 1) / total
-        x = cx + math.cos(angle) * radius
-        y = cy + math.sin(angle) * radius
-        color = hash_color(link)
-        size = 8 + (i % 7)
-        draw.ellipse([(x - size, y - size), (x + size, y + size)], fill=color + (200,))
+    i = np.arange(len(links))
+    angle = np.radians(i * 15)
+    radius = max_radius * (i + 1) / total
+    xs = (cx + np.cos(angle) * radius).tolist()
+    ys = (cy + np.sin(angle) * radius).tolist()
+    sizes = (8 + i % 7).tolist()
+    colors = [hash_color(link) + (200,) for link in links]
+    return list(zip(xs, ys, sizes, colors))
+
+
+def draw_links(draw: ImageDraw.ImageDraw, layout: List[tuple]) -> None:
+    """Render each laid-out link as an orb along a spiral path."""
+
+    for x, y, size, color in layout:
+        draw.ellipse([(x - size, y - size), (x + size, y + size)], fill=color)
 
 
 def generate_art(source: Path, width: int, height: int) -> Image.Image:
     """Create the visionary artwork based on links from ``source``."""
 
-    with source.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
-    links = list(collect_links(data))
+    links = load_links(source)
 
     image = Image.new("RGBA", (width, height))
     draw = ImageDraw.Draw(image, "RGBA")
 
     # Background gradient
-    paint_gradient(draw, width, height)
+    paint_gradient(image)
 
     # Spiraling link orbs
-    draw_links(draw, links, width, height)
+    draw_links(draw, layout_links(links, width, height))
 
     return image
 
@@ -122,7 +170,7 @@ def main() -> None:
     args = parser.parse_args()
 
     art = generate_art(args.source, args.width, args.height)
-    art.save(args.output)
+    art.save(args.output, compress_level=png_level())
     print(f"Art saved to {args.output.resolve()}")
 
 
@@ -9,10 +9,13 @@ The image is rendered at 1920x1080 resolution and saved as
 from __future__ import annotations
 
 import math
-import random
 from pathlib import Path
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+from mandala import gradient_rows, vertical_gradient
+from png_options import png_level
 
 # Canvas configuration ------------------------------------------------------
 WIDTH, HEIGHT = 1920, 1080
@@ -27,16 +30,15 @@ PALETTE = [
     "#E76F51",  # Coral Dusk
 ]
 
+# Palette parsed once; orbs and spokes index these tuples
+PALETTE_RGB = [ImageColor.getrgb(c) for c in PALETTE]
+
 
-def blend_background(draw: ImageDraw.ImageDraw) -> None:
+def blend_background(image: Image.Image) -> None:
     """Fill background with a vertical gradient."""
 
-    for y in range(HEIGHT):
-        ratio = y / HEIGHT
-        r = int(13 * (1 - ratio) + 231 * ratio)
-        g = int(27 * (1 - ratio) + 111 * ratio)
-        b = int(42 * (1 - ratio) + 81 * ratio)
-        draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
+    rows = gradient_rows(HEIGHT, (13, 27, 42), (231, 111, 81))
+    image.paste(vertical_gradient(WIDTH, rows))
 
 
 def surreal_forms(draw: ImageDraw.ImageDraw) -> None:
@@ -44,23 +46,27 @@ def surreal_forms(draw: ImageDraw.ImageDraw) -> None:
 
     cx, cy = WIDTH / 2, HEIGHT / 2
     max_radius = min(cx, cy)
-
-    # Spiral of colored orbs
-    for step in range(360):
-        angle = step * math.pi / 180
-        radius = (step / 360) * max_radius
-        x = cx + math.cos(angle * 3) * radius
-        y = cy + math.sin(angle * 3) * radius
-        color = random.choice(PALETTE)
-        size = 4 + step % 12
+    # Palette picks for all 360 orbs and 24 spokes in one draw
+    rng = np.random.default_rng()
+    picks = rng.integers(0, len(PALETTE_RGB), size=360 + 24).tolist()
+    colors = [PALETTE_RGB[k] for k in picks]
+
+    # Spiral of colored orbs; positions come from one trig pass
+    steps = np.arange(360)
+    angles = steps * math.pi / 180
+    radii = (steps / 360) * max_radius
+    xs = (cx + np.cos(angles * 3) * radii).tolist()
+    ys = (cy + np.sin(angles * 3) * radii).tolist()
+    sizes = (4 + steps % 12).tolist()
+    for x, y, size, color in zip(xs, ys, sizes, colors):
         draw.ellipse([x - size, y - size, x + size, y + size], fill=color, outline=color)
 
     # Radiating spokes
-    for step in range(0, 360, 15):
-        angle = math.radians(step)
-        x = cx + math.cos(angle) * max_radius
-        y = cy + math.sin(angle) * max_radius
-        draw.line([(cx, cy), (x, y)], fill=random.choice(PALETTE), width=2)
+    spokes = np.radians(np.arange(0, 360, 15))
+    xs = (cx + np.cos(spokes) * max_radius).tolist()
+    ys = (cy + np.sin(spokes) * max_radius).tolist()
+    for x, y, color in zip(xs, ys, colors[360:]):
+        draw.line([(cx, cy), (x, y)], fill=color, width=2)
 
 
 def main() -> None:
@@ -69,11 +75,11 @@ def main() -> None:
     image = Image.new("RGB", (WIDTH, HEIGHT), PALETTE[0])
     draw = ImageDraw.Draw(image)
 
-    blend_background(draw)
+    blend_background(image)
     surreal_forms(draw)
 
     output = Path("Visionary_Dream.png")
-    image.save(output)
+    image.save(output, compress_level=png_level())
     print(f"Art saved to {output.resolve()}")
 
 
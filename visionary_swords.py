@@ -1,32 +1,22 @@
-
 #!/usr/bin/env python3
 """Visionary Swords Generator.
 
 Creates a museum-quality piece of visionary art inspired by the Swords suit of the
 Minor Arcana using an indigo-silver storm palette. The image is rendered at
 1920x1080 resolution and saved as "Visionary_Dream.png".
-=======
-"""Swords Suit Visionary Art Generator.
-
-Creates a museum-quality piece inspired by the Swords suit of the Minor Arcana.
-Rendered at 1920x1080 and saved as "Visionary_Dream.png".
-
-
-from __future__ import annotations
-
 """
 
 from __future__ import annotations
 
-
 import math
-
-
-import random
 from pathlib import Path
 
+import numpy as np
 from PIL import Image, ImageDraw
 
+from mandala import gradient_rows, vertical_gradient
+from png_options import png_level
+
 WIDTH, HEIGHT = 1920, 1080
 OUTPUT = Path("Visionary_Dream.png")
 
@@ -38,26 +28,25 @@ PALETTE = [
     "#000000",  # Raven Black
 ]
 
-def blend_background(draw: ImageDraw.ImageDraw) -> None:
+def blend_background(image: Image.Image) -> None:
     """Fill background with a vertical indigo-to-silver gradient."""
-    for y in range(HEIGHT):
-        t = y / HEIGHT
-        r = int(26 * (1 - t) + 192 * t)
-        g = int(35 * (1 - t) + 192 * t)
-        b = int(126 * (1 - t) + 192 * t)
-        draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
+    rows = gradient_rows(HEIGHT, (26, 35, 126), (192, 192, 192))
+    image.paste(vertical_gradient(WIDTH, rows))
 
 def draw_lightning(draw: ImageDraw.ImageDraw, bolts: int = 5) -> None:
     """Render jagged lightning bolts as shining swords."""
-    for _ in range(bolts):
-        x = random.randint(0, WIDTH)
-        y = 0
-        points = [(x, y)]
-        while y < HEIGHT:
-            x += random.randint(-20, 20)
-            y += random.randint(20, 40)
-            points.append((x, y))
-        draw.line(points, fill=PALETTE[3], width=3)
+    rng = np.random.default_rng()
+    # Enough 20-40 px drops for the shortest bolt to reach the bottom edge
+    steps = -(-HEIGHT // 20)
+    xs = np.empty((bolts, steps + 1), dtype=np.int64)
+    xs[:, 0] = rng.integers(0, WIDTH + 1, size=bolts)
+    xs[:, 1:] = xs[:, :1] + np.cumsum(rng.integers(-20, 21, size=(bolts, steps)), axis=1)
+    ys = np.zeros((bolts, steps + 1), dtype=np.int64)
+    ys[:, 1:] = np.cumsum(rng.integers(20, 41, size=(bolts, steps)), axis=1)
+    # Each bolt stops at its first point at or below HEIGHT
+    ends = np.argmax(ys >= HEIGHT, axis=1) + 1
+    for row_x, row_y, end in zip(xs.tolist(), ys.tolist(), ends.tolist()):
+        draw.line(list(zip(row_x[:end], row_y[:end])), fill=PALETTE[3], width=3)
 
 def draw_swords(draw: ImageDraw.ImageDraw) -> None:
     """Draw central crossed swords."""
@@ -67,22 +56,16 @@ def draw_swords(draw: ImageDraw.ImageDraw) -> None:
     draw.line([(cx - 60, cy + length), (cx - 60, cy - length)], fill=PALETTE[3], width=4)
     draw.rectangle([(cx - 80, cy - 20), (cx - 40, cy)], fill=PALETTE[3])
 
-
-    draw.line([(cx - 60, cy + length), (cx - 60, cy - length)], fill=PALETTE[3], width=4)
-    draw.rectangle([(cx - 80, cy - 20), (cx - 40, cy)], fill=PALETTE[3])
-
-    draw.line([(cx - 60, cy + length), (cx - 60, cy - length)], fill=PALETTE[3], width=4)
-    draw.rectangle([(cx - 80, cy - 20), (cx - 40, cy)], fill=PALETTE[3])
-
     draw.line([(cx + 60, cy + length), (cx + 60, cy - length)], fill=PALETTE[3], width=4)
     draw.rectangle([(cx + 40, cy - 20), (cx + 80, cy)], fill=PALETTE[3])
 
 def draw_ravens(draw: ImageDraw.ImageDraw, count: int = 7) -> None:
     """Scatter raven silhouettes across the sky."""
-    for _ in range(count):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT // 2)
-        size = random.randint(10, 20)
+    rng = np.random.default_rng()
+    xs = rng.integers(0, WIDTH + 1, size=count).tolist()
+    ys = rng.integers(0, HEIGHT // 2 + 1, size=count).tolist()
+    sizes = rng.integers(10, 21, size=count).tolist()
+    for x, y, size in zip(xs, ys, sizes):
         draw.line([(x - size, y), (x, y - size)], fill=PALETTE[4], width=2)
         draw.line([(x, y - size), (x + size, y)], fill=PALETTE[4], width=2)
 
@@ -90,17 +73,13 @@ def main() -> None:
     """Generate the artwork and save to disk."""
     image = Image.new("RGB", (WIDTH, HEIGHT), PALETTE[0])
     draw = ImageDraw.Draw(image)
-    blend_background(draw)
+    blend_background(image)
     draw_lightning(draw)
     draw_swords(draw)
     draw_ravens(draw)
 
-
-    image.save(OUTPUT)
-
-    output = Path("Visionary_Dream.png")
-    image.save(output)
-    print(f"Art saved to {output.resolve()}")
+    image.save(OUTPUT, compress_level=png_level())
+    print(f"Art saved to {OUTPUT.resolve()}")
 
 if __name__ == "__main__":
     main()
@@ -12,15 +12,18 @@ from __future__ import annotations
 
 # Imports and setup ---------------------------------------------------------
 import argparse
-import math
 import struct
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 
 import numpy as np
 from PIL import Image, ImageColor, ImageDraw
 
+from mandala import vertical_gradient
+from png_options import png_level
+
 # Tarot influences ----------------------------------------------------------
 TAROT_PALETTES: Dict[str, str] = {
     "Fool": "#FFD700",  # Golden optimism
@@ -35,45 +38,49 @@ BASE_PALETTE = [
     "#415A77",  # Steel Blue
     "#E0E1DD",  # Mist White
 ]
+BASE_PALETTE_RGB = tuple(ImageColor.getrgb(c) for c in BASE_PALETTE)
 
 
-def gradient_background(draw: ImageDraw.ImageDraw, width: int, height: int, card: str) -> None:
+def gradient_background(image: Image.Image, card: str) -> None:
     """Paint a vertical gradient blending tarot color with base palette."""
 
+    width, height = image.size
     tarot_color = TAROT_PALETTES.get(card, "#F4A261")
-    start_rgb = ImageColor.getrgb(tarot_color)
-    end_rgb = ImageColor.getrgb(BASE_PALETTE[-1])
+    start_rgb = np.array(ImageColor.getrgb(tarot_color))
+    end_rgb = np.array(ImageColor.getrgb(BASE_PALETTE[-1]))
+
+    t = (np.arange(height) / (height - 1))[:, None]
+    col = (start_rgb * (1 - t) + end_rgb * t).astype(np.uint8)
+    image.paste(vertical_gradient(width, col))
 
-    for y in range(height):
-        t = y / (height - 1)
-        r = int(start_rgb[0] * (1 - t) + end_rgb[0] * t)
-        g = int(start_rgb[1] * (1 - t) + end_rgb[1] * t)
-        b = int(start_rgb[2] * (1 - t) + end_rgb[2] * t)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
 
+def spiral(draw: ImageDraw.ImageDraw, width: int, height: int, colors: list | None = None) -> None:
+    """Render a translucent spiral as a focal point.
 
-def spiral(draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
-    """Render a translucent spiral as a focal point."""
+    ``colors`` overrides the fills, e.g. with palette indices when drawing
+    onto a ``"P"`` image.
+    """
 
     cx, cy = width / 2, height / 2
     max_radius = min(cx, cy) * 0.9
-    for i in range(720):
-        angle = math.radians(i)
-        radius = max_radius * i / 720
-        x = cx + math.cos(angle) * radius
-        y = cy + math.sin(angle) * radius
-        color = ImageColor.getrgb(BASE_PALETTE[i % len(BASE_PALETTE)])
-        draw.ellipse([(x - 4, y - 4), (x + 4, y + 4)], fill=color + (180,))
+    if colors is None:
+        colors = [c + (180,) for c in BASE_PALETTE_RGB]
+    i = np.arange(720)
+    angle = np.radians(i)
+    radius = max_radius * i / 720
+    xs = (cx + np.cos(angle) * radius).tolist()
+    ys = (cy + np.sin(angle) * radius).tolist()
+    for k, (x, y) in enumerate(zip(xs, ys)):
+        draw.ellipse([(x - 4, y - 4), (x + 4, y + 4)], fill=colors[k % len(colors)])
 
 
 def image_to_freqs(image: Image.Image, count: int = 8) -> np.ndarray:
     """Map average row brightness to audio frequencies."""
 
-    gray = image.convert("L")
-    arr = np.array(gray)
-    row_avgs = arr.mean(axis=1)
-    indices = np.linspace(0, len(row_avgs) - 1, count).astype(int)
-    brightness = row_avgs[indices] / 255.0
+    arr = np.asarray(image.convert("L"))
+    # Only the sampled rows are averaged
+    indices = np.linspace(0, arr.shape[0] - 1, count).astype(int)
+    brightness = arr[indices].mean(axis=1) / 255.0
     return 220 + brightness * 880  # Map to 220-1100 Hz
 
 
@@ -82,12 +89,9 @@ def synthesize(freqs: np.ndarray, out_file: Path) -> None:
 
     sample_rate = 44100
     duration = 0.4  # seconds per tone
-    frames = []
-    for f in freqs:
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        wave_data = 0.5 * np.sin(2 * np.pi * f * t)
-        frames.extend(wave_data)
-    audio = np.array(frames)
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    # One row per tone, played back to back
+    audio = (0.5 * np.sin(2 * np.pi * np.asarray(freqs)[:, None] * t)).ravel()
     max_amp = np.max(np.abs(audio))
     scaled = (audio / max_amp * 32767).astype(np.int16)
 
@@ -101,12 +105,34 @@ def synthesize(freqs: np.ndarray, out_file: Path) -> None:
 def generate_art(width: int, height: int, card: str) -> Image.Image:
     """Create visionary artwork influenced by a tarot card."""
 
-    image = Image.new("RGBA", (width, height))
-    draw = ImageDraw.Draw(image, "RGBA")
-
-    gradient_background(draw, width, height, card)
-    spiral(draw, width, height)
-
+    def background() -> Image.Image:
+        layer = Image.new("RGBA", (width, height))
+        gradient_background(layer, card)
+        return layer
+
+    def foreground() -> Image.Image:
+        # The spiral only ever holds transparent pixels or one of the base
+        # colors at alpha 180, so draw 1-byte palette indices and expand
+        # them to RGBA once at the end.
+        layer = Image.new("P", (width, height), 0)
+        layer.putpalette(
+            [0, 0, 0, 0] + [v for c in BASE_PALETTE_RGB for v in c + (180,)], "RGBA"
+        )
+        indices = list(range(1, len(BASE_PALETTE_RGB) + 1))
+        spiral(ImageDraw.Draw(layer), width, height, indices)
+        return layer.convert("RGBA")
+
+    # The stages share no pixels until compositing, and NumPy/Pillow release
+    # the GIL in their C loops, so render both layers concurrently.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        bg = pool.submit(background)
+        fg = pool.submit(foreground)
+        image, layer = bg.result(), fg.result()
+
+    # Spiral pixels replace the gradient, alpha 180 included, exactly as
+    # drawing them straight onto the RGBA canvas did; blending instead
+    # would shift the row brightness that image_to_freqs turns into audio.
+    image.paste(layer, mask=layer.getchannel("A").point(lambda a: 255 if a else 0))
     return image
 
 
@@ -127,7 +153,7 @@ def main() -> None:
     args = parser.parse_args()
 
     art = generate_art(args.width, args.height, args.card)
-    art.save(args.output)
+    art.save(args.output, compress_level=png_level())
 
     freqs = image_to_freqs(art)
     synthesize(freqs, args.audio)